@@ -0,0 +1,282 @@
+import argparse
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import Config, SearchFilters
+from database import JobDatabase
+from linkedin_automation import LinkedInAutomation
+from log_pipeline import configure_logging
+from benchmarks.fake_linkedin import FakeLinkedInServer
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Drives login -> search_jobs -> save_jobs_to_database against the local fake
+# server in headless Chrome and reports throughput, per-phase latency percentiles
+# and peak memory. Run from the repository root:
+#
+#   python -m benchmarks.crawl_benchmark --jobs 200 --output baseline.json
+#   python -m benchmarks.crawl_benchmark --jobs 200 --baseline baseline.json
+
+PERCENTILES = [50, 90, 95, 99]
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+class PhaseTimer:
+    # Wraps methods on the automation so every call is timed under a phase name
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+    
+    def record(self, phase: str, elapsed: float):
+        with self._lock:
+            self.samples.setdefault(phase, []).append(elapsed)
+    
+    def wrap(self, owner, method_name: str, phase: str):
+        method = getattr(owner, method_name)
+        
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(phase, time.perf_counter() - start)
+        
+        setattr(owner, method_name, timed)
+    
+    def summary(self) -> Dict:
+        with self._lock:
+            phases = {phase: list(samples) for phase, samples in self.samples.items()}
+        
+        result = {}
+        for phase, samples in sorted(phases.items()):
+            stats = {"count": len(samples), "total_seconds": round(sum(samples), 4)}
+            for pct in PERCENTILES:
+                stats[f"p{pct}_ms"] = round(percentile(samples, pct) * 1000, 2)
+            stats["max_ms"] = round(max(samples) * 1000, 2)
+            result[phase] = stats
+        return result
+
+class RssSampler:
+    # Peak resident memory of this process plus every child (chromedriver and
+    # Chrome). Child processes need psutil; without it only Python is measured.
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.peak_tree_bytes = 0
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _sample(self) -> int:
+        process = psutil.Process()
+        total = 0
+        for member in [process] + process.children(recursive=True):
+            try:
+                total += member.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    
+    def start(self) -> "RssSampler":
+        if psutil is not None:
+            self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+    
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_tree_bytes = max(self.peak_tree_bytes, self._sample())
+            self._stop.wait(self.interval)
+    
+    def stop(self) -> Dict:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        
+        # ru_maxrss is kilobytes on Linux and bytes on macOS
+        python_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            python_peak *= 1024
+        
+        return {
+            "python_peak_mb": round(python_peak / 2 ** 20, 1),
+            "process_tree_peak_mb": round(self.peak_tree_bytes / 2 ** 20, 1) if self._thread else None
+        }
+
+def build_config(args, base_url: str, work_dir: str) -> Config:
+    config = Config()
+    config.linkedin_base_url = base_url
+    config.linkedin_email = "benchmark@example.com"
+    config.linkedin_password = "benchmark"
+    config.headless_browser = not args.show_browser
+    config.max_jobs_per_search = args.jobs
+    # Lets the automation reopen a results page by its start= offset
+    config.search_page_size = args.page_size
+    config.delay_between_requests = args.delay
+    # The limiter may only speed up to the requested delay, never past it
+    config.min_request_delay = args.delay
+    # Every run starts cold: no saved cookies, profile or high-water marks
+    config.reuse_session = False
+    config.session_cookies_file = os.path.join(work_dir, "session.json")
+    config.chrome_profile_dir = ""
+    config.incremental_crawl = False
+    config.enrichment_workers = args.enrichment_workers
+    config.pipeline_enrichment = args.pipeline
+    config.pipeline_queue_size = args.pipeline_queue_size
+    config.detail_fetch_mode = args.detail_fetch_mode
+    config.card_extraction_mode = args.card_extraction_mode
+    config.log_level = args.log_level
+    config.block_resources = args.block_resources
+    return config
+
+def run_benchmark(args) -> Dict:
+    timer = PhaseTimer()
+    work_dir = tempfile.mkdtemp(prefix="crawl-benchmark-")
+    server = FakeLinkedInServer(total_jobs=args.total_jobs, page_size=args.page_size,
+                                latency=args.latency_ms / 1000).start()
+    sampler = RssSampler().start()
+    db = JobDatabase(os.path.join(work_dir, "jobs.db"))
+    automation = None
+    
+    try:
+        config = build_config(args, server.base_url, work_dir)
+        configure_logging(config)
+        
+        start = time.perf_counter()
+        automation = LinkedInAutomation(config, db=db)
+        timer.record("driver_startup", time.perf_counter() - start)
+        
+        timer.wrap(automation, "_extract_page_jobs", "card_extraction")
+        timer.wrap(automation, "fetch_job_details", "detail_fetch")
+        timer.wrap(automation, "save_jobs_to_database", "save_page")
+        timer.wrap(db, "add_job", "db_insert")
+        
+        start = time.perf_counter()
+        if not automation.login():
+            raise RuntimeError("Login against the fake server failed")
+        timer.record("login", time.perf_counter() - start)
+        
+        crawl_start = time.perf_counter()
+        jobs = automation.search_jobs(SearchFilters(job_title=args.keywords))
+        timer.record("search", time.perf_counter() - crawl_start)
+        
+        # A crawl that stops paging early still "finishes", with numbers that look
+        # fast because they cover less work; refuse to report those
+        expected_pages = math.ceil(min(args.jobs, args.total_jobs) / args.page_size)
+        pages = automation.last_search_stats.get("pages_processed", 0)
+        if pages < expected_pages:
+            raise RuntimeError(f"Search stopped after {pages} of {expected_pages} result pages")
+        
+        # Same follow-up save as the CLI; every job is already stored, so this
+        # measures the dedup path
+        automation.save_jobs_to_database(jobs)
+        crawl_seconds = time.perf_counter() - crawl_start
+        
+        jobs_saved = db.count_jobs()
+        return {
+            "settings": {
+                "jobs": args.jobs,
+                "total_jobs": args.total_jobs,
+                "page_size": args.page_size,
+                "latency_ms": args.latency_ms,
+                "delay": args.delay,
+                "enrichment_workers": args.enrichment_workers,
+                "pipeline": args.pipeline,
+                "pipeline_queue_size": args.pipeline_queue_size,
+                "detail_fetch_mode": args.detail_fetch_mode,
+                "card_extraction_mode": args.card_extraction_mode,
+                "log_level": args.log_level,
+                "block_resources": args.block_resources
+            },
+            "server": "fake_linkedin",
+            "pages_processed": pages,
+            "jobs_saved": jobs_saved,
+            "crawl_seconds": round(crawl_seconds, 3),
+            "jobs_per_minute": round(jobs_saved / crawl_seconds * 60, 1) if crawl_seconds else 0.0,
+            "phases": timer.summary(),
+            "waits": automation.waiter.report(),
+            "metrics": automation.metrics.summary(),
+            "server_requests": dict(server.request_counts),
+            "memory": sampler.stop()
+        }
+    finally:
+        sampler.stop()
+        if automation:
+            automation.close()
+        db.close()
+        server.stop()
+
+def print_results(results: Dict, baseline: Optional[Dict] = None):
+    print("\n=== CRAWL BENCHMARK (local fake LinkedIn server) ===")
+    print(f"Jobs saved: {results['jobs_saved']} from {results['pages_processed']} pages in {results['crawl_seconds']}s")
+    line = f"Throughput: {results['jobs_per_minute']} jobs/min"
+    if baseline and baseline.get("jobs_per_minute"):
+        change = (results["jobs_per_minute"] / baseline["jobs_per_minute"] - 1) * 100
+        line += f" (baseline {baseline['jobs_per_minute']}, {change:+.1f}%)"
+    print(line)
+    
+    memory = results["memory"]
+    print(f"Peak RSS: python {memory['python_peak_mb']} MB", end="")
+    if memory["process_tree_peak_mb"] is not None:
+        print(f", python + browser {memory['process_tree_peak_mb']} MB")
+    else:
+        print(" (install psutil to include the browser)")
+    
+    print(f"\n{'phase':<18}{'count':>7}{'p50 ms':>10}{'p90 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    baseline_phases = baseline.get("phases", {}) if baseline else {}
+    for phase, stats in results["phases"].items():
+        row = (f"{phase:<18}{stats['count']:>7}{stats['p50_ms']:>10}{stats['p90_ms']:>10}"
+               f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}")
+        if phase in baseline_phases and baseline_phases[phase]["p95_ms"]:
+            change = (stats["p95_ms"] / baseline_phases[phase]["p95_ms"] - 1) * 100
+            row += f"   p95 {change:+.1f}% vs baseline"
+        print(row)
+    
+    print(f"\nServer requests: {results['server_requests']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end crawl benchmark against a local fake LinkedIn")
+    parser.add_argument("--jobs", type=int, default=100, help="max_jobs_per_search for the run")
+    parser.add_argument("--total-jobs", type=int, default=200, help="postings the fake search returns")
+    parser.add_argument("--page-size", type=int, default=25)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated server latency per response")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds between page loads for the run")
+    parser.add_argument("--keywords", default="software engineer")
+    parser.add_argument("--enrichment-workers", type=int, default=1)
+    parser.add_argument("--pipeline", action="store_true", help="page and enrich concurrently")
+    parser.add_argument("--pipeline-queue-size", type=int, default=Config().pipeline_queue_size)
+    parser.add_argument("--detail-fetch-mode", choices=["browser", "http"], default="browser")
+    parser.add_argument("--card-extraction-mode", choices=["html", "webdriver"], default="html")
+    parser.add_argument("--block-resources", default=Config().block_resources,
+                        help='resource types Chrome skips, e.g. "images,fonts,trackers"; "" loads everything')
+    parser.add_argument("--log-level", choices=["debug", "info", "warning", "error"], default="info")
+    parser.add_argument("--show-browser", action="store_true", help="run Chrome with a window")
+    parser.add_argument("--output", help="write the results as JSON, e.g. to keep as a baseline")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    
+    results = run_benchmark(args)
+    print_results(results, baseline)
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+# A local stand-in for the handful of LinkedIn pages LinkedInAutomation drives:
+# login form, feed (session check), paginated job search and job detail pages.
+# The markup only carries the classes and attributes the automation selects on.
+# /jobs/view/<name>/ serves fixtures/<name>.html when that file exists, and
+# /jobs/view/throttled/ answers 429, for the HttpDetailFetcher tests.
+
+SESSION_COOKIE = "li_at"
+SESSION_TOKEN = "benchmark-session"
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+TITLES = ["Software Engineer", "Data Engineer", "Backend Developer", "Platform Engineer",
+          "Machine Learning Engineer", "Site Reliability Engineer", "Frontend Developer"]
+CITIES = ["Austin, TX", "New York, NY", "San Francisco, CA", "Chicago, IL", "Remote"]
+
+# Pages pull in the same kinds of assets as the real site so resource blocking
+# shows up in the numbers. The tag manager path mimics a third-party host so the
+# tracker block patterns match it.
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<link rel="stylesheet" href="/static/site.css">
+<script src="/googletagmanager.com/gtm.js" async></script></head>
+<body>{nav}{body}</body></html>"""
+
+NAV = '<nav class="global-nav"><a href="/feed/">Home</a> <a href="/jobs/search/">Jobs</a></nav>'
+
+LOGIN_FORM = """<form method="post" action="/uas/login-submit">
+<input id="username" name="session_key" type="text">
+<input id="password" name="session_password" type="password">
+{error}
+<button type="submit">Sign in</button>
+</form>"""
+
+SITE_CSS = """@font-face { font-family: "Bench Sans"; src: url("/static/bench-sans.woff2") format("woff2"); }
+body { font-family: "Bench Sans", sans-serif; }
+.job-card-logo { width: 48px; height: 48px; }
+"""
+
+def make_png(size: int = 128) -> bytes:
+    # Random pixels so the image neither compresses away nor decodes for free
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    rows = b"".join(b"\x00" + os.urandom(size * 3) for _ in range(size))
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+ASSET_TYPES = {
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".png": "image/png",
+    ".woff2": "font/woff2"
+}
+
+class FakeLinkedInServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, total_jobs: int = 200,
+                 page_size: int = 25, latency: float = 0.0, description_paragraphs: int = 12):
+        self.total_jobs = total_jobs
+        self.page_size = page_size
+        self.latency = latency
+        self.description_paragraphs = description_paragraphs
+        self.request_counts = {}
+        self.assets = {
+            ".css": SITE_CSS.encode("utf-8"),
+            ".js": b"window.dataLayer = window.dataLayer || [];",
+            ".png": make_png(),
+            ".woff2": os.urandom(60 * 1024)
+        }
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "FakeLinkedInServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-linkedin", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    def count(self, kind: str):
+        with self._lock:
+            self.request_counts[kind] = self.request_counts.get(kind, 0) + 1
+    
+    def job_id(self, keywords: str, index: int) -> str:
+        # Stable per query, so a rerun against the same database sees the same postings
+        digest = hashlib.sha1(f"{keywords}|{index}".encode()).hexdigest()
+        return str(3000000000 + int(digest[:8], 16))
+    
+    def job_summary(self, keywords: str, index: int) -> dict:
+        posted = datetime(2026, 1, 1) + timedelta(days=self.total_jobs - index)
+        return {
+            "id": self.job_id(keywords, index),
+            "title": f"{TITLES[index % len(TITLES)]} {index + 1}",
+            "company": f"Company {index % 37 + 1}",
+            "location": CITIES[index % len(CITIES)],
+            "posted": posted.strftime("%Y-%m-%d")
+        }
+    
+    def render_search(self, keywords: str, start: int) -> str:
+        cards = []
+        for index in range(start, min(start + self.page_size, self.total_jobs)):
+            job = self.job_summary(keywords, index)
+            cards.append(f"""<li class="jobs-search-results__list-item" data-job-id="{job['id']}">
+<img class="job-card-logo" src="/static/logos/{job['id']}.png" alt="">
+<a class="job-card-container__link" href="/jobs/view/{job['id']}/?refId=bench">{escape(job['title'])}</a>
+<span class="job-card-container__company-name">{escape(job['company'])}</span>
+<span class="job-card-container__metadata-item">{escape(job['location'])}</span>
+<span>Easy Apply</span>
+<time datetime="{job['posted']}">{job['posted']}</time>
+</li>""")
+        
+        next_start = start + self.page_size
+        if next_start < self.total_jobs:
+            query = urlencode({"keywords": keywords, "start": next_start})
+            pagination = (f'<button aria-label="View next page" '
+                          f'onclick="window.location.href=\'/jobs/search/?{query}\'">Next</button>')
+        else:
+            pagination = "<p>End of results</p>"
+        
+        body = (f'<div class="jobs-search-results-list"><ul>{"".join(cards)}</ul></div>'
+                f'<div class="jobs-search-results-list__pagination">{pagination}</div>')
+        return PAGE_TEMPLATE.format(title=f"{escape(keywords)} Jobs", nav=NAV, body=body)
+    
+    def render_detail(self, job_id: str) -> str:
+        fixture = os.path.join(FIXTURES_DIR, f"{os.path.basename(job_id)}.html")
+        if os.path.exists(fixture):
+            with open(fixture, encoding="utf-8") as f:
+                return f.read()
+        
+        paragraphs = "".join(
+            f"<p>Paragraph {i + 1} of the description for posting {job_id}. "
+            "You will design, build and operate services used by millions of members, "
+            "work with a small team and own features from design review to production.</p>"
+            for i in range(self.description_paragraphs)
+        )
+        body = f"""<img class="job-card-logo" src="/static/logos/{job_id}.png" alt="">
+<div class="job-details-jobs-unified-top-card__job-insight"><span>$120,000/yr - $160,000/yr</span></div>
+<a data-control-name="jobdetails_topcard_inapply" href="/jobs/view/{job_id}/apply/">Apply</a>
+<div class="job-details__description-text">{paragraphs}</div>"""
+        return PAGE_TEMPLATE.format(title=f"Job {job_id}", nav=NAV, body=body)
+    
+    def _handler_class(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def log_message(self, format, *args):
+                pass
+            
+            def logged_in(self) -> bool:
+                return f"{SESSION_COOKIE}={SESSION_TOKEN}" in (self.headers.get("Cookie") or "")
+            
+            def send_html(self, html: str, status: int = 200, headers: Optional[dict] = None):
+                if server.latency:
+                    time.sleep(server.latency)
+                payload = html.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def send_asset(self, path: str):
+                extension = os.path.splitext(path)[1]
+                if extension not in ASSET_TYPES:
+                    self.send_error(404)
+                    return
+                server.count(f"asset{extension}")
+                payload = server.assets[extension]
+                self.send_response(200)
+                self.send_header("Content-Type", ASSET_TYPES[extension])
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def redirect(self, location: str, headers: Optional[dict] = None):
+                self.send_response(302)
+                self.send_header("Location", location)
+                self.send_header("Content-Length", "0")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+            
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                
+                if url.path.startswith(("/static/", "/googletagmanager.com/")):
+                    self.send_asset(url.path)
+                elif url.path in ("/", "/login"):
+                    server.count("login_page")
+                    self.send_html(PAGE_TEMPLATE.format(title="Sign in", nav="", body=LOGIN_FORM.format(error="")))
+                elif not self.logged_in():
+                    server.count("authwall")
+                    self.redirect("/login")
+                elif url.path == "/feed/":
+                    server.count("feed")
+                    self.send_html(PAGE_TEMPLATE.format(title="Feed", nav=NAV, body="<main>Feed</main>"))
+                elif url.path == "/jobs/search/":
+                    server.count("search")
+                    start = int(params.get("start", "0") or 0)
+                    self.send_html(server.render_search(params.get("keywords", ""), start))
+                elif url.path == "/jobs/view/throttled/":
+                    server.count("throttled")
+                    self.send_html(PAGE_TEMPLATE.format(title="Too many requests", nav="", body=""), status=429,
+                                   headers={"Retry-After": "30"})
+                elif url.path.startswith("/jobs/view/"):
+                    server.count("detail")
+                    self.send_html(server.render_detail(url.path.split("/")[3]))
+                else:
+                    self.send_html(PAGE_TEMPLATE.format(title="Not found", nav=NAV, body=""), status=404)
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode()).items()}
+                server.count("login_submit")
+                
+                if not form.get("session_key") or not form.get("session_password"):
+                    error = '<div class="form__label--error">Please enter your email and password.</div>'
+                    self.send_html(PAGE_TEMPLATE.format(title="Sign in", nav="", body=LOGIN_FORM.format(error=error)))
+                    return
+                
+                self.redirect("/feed/", {"Set-Cookie": f"{SESSION_COOKIE}={SESSION_TOKEN}; Path=/"})
+        
+        return Handler
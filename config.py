@@ -1,4 +1,5 @@
 import os
+import json
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -12,14 +13,56 @@ class SearchFilters:
     remote_option: str = ""
     salary_range: str = ""
 
+@dataclass
+class SavedSearch:
+    filters: SearchFilters
+    interval_minutes: float = 60.0
+    enabled: bool = True
+
 @dataclass
 class Config:
     linkedin_email: str = ""
     linkedin_password: str = ""
+    linkedin_base_url: str = "https://www.linkedin.com"  # pointed at a local stand-in by the benchmarks
     search_filters: SearchFilters = None
     max_jobs_per_search: int = 50
-    delay_between_requests: int = 3
+    delay_between_requests: int = 3  # starting pace; the rate limiter adapts it between the bounds below
+    min_request_delay: float = 1.0
+    max_request_delay: float = 60.0
+    request_jitter: float = 0.3  # +/- fraction applied to each request slot
+    throttle_backoff: float = 30.0  # first pause after a throttling signal, doubled on each repeat
     headless_browser: bool = False
+    dedup_max_exact_keys: int = 500000
+    incremental_crawl: bool = True  # stop paging once a page only has jobs from earlier runs
+    sort_by_recency: bool = True
+    search_mark_max_ids: int = 1000
+    search_page_size: int = 25  # results per search page, used to jump straight to a resumed page
+    max_job_retries: int = 3  # attempts before a queued job is left out of --resume
+    search_workers: int = 2  # browsers used when running several searches at once
+    reuse_session: bool = True
+    session_cookies_file: str = "linkedin_session.json"
+    chrome_profile_dir: str = ""  # persistent Chrome user-data-dir, disabled when empty
+    driver_cache_file: str = ".chromedriver_cache.json"
+    prewarm_browser: bool = False  # keep a started Chrome ready for the next GUI search
+    enrichment_workers: int = 1  # browser instances fetching job details in parallel
+    enrichment_worker_delay: float = 0.0  # extra pause per worker after each detail page
+    pipeline_enrichment: bool = False  # enrich on the worker browsers while the search browser keeps paging
+    pipeline_queue_size: int = 100  # harvested jobs allowed to wait for enrichment before paging pauses
+    detail_fetch_mode: str = "browser"  # "http" fetches detail pages with the browser's cookies
+    card_extraction_mode: str = "html"  # "html" parses page_source once, "webdriver" queries each card
+    block_resources: str = "images,media,fonts,trackers"  # also "stylesheets"; empty loads everything
+    resource_allow_patterns: str = ""  # comma-separated URL patterns exempt from blocking, e.g. "*.svg"
+    metrics_json_file: str = ""  # JSON summary of crawl metrics, rewritten after each search
+    metrics_prometheus_file: str = ""  # Prometheus text format, e.g. for the node exporter textfile collector
+    metrics_port: int = 0  # serve /metrics on this port when non-zero
+    log_level: str = "info"  # "debug" adds per-card and per-job diagnostics
+    log_sink: str = ""  # "console", "file" or "gui"; empty uses the console for the CLI and the log tab for the GUI
+    log_file: str = "linkedin_automation.log"
+    debug_log_rate: float = 20.0  # debug messages per second let through, 0 for no limit
+    daemon_searches_file: str = ""  # JSON saved searches loaded into the database when --daemon starts
+    daemon_interval_minutes: float = 60.0  # for saved searches that don't set interval_minutes
+    daemon_jitter: float = 0.2  # +/- fraction applied to every scheduled run
+    daemon_browser_max_age_hours: float = 12.0  # restart the long-lived browser after this long, 0 never
     
     def __post_init__(self):
         if self.search_filters is None:
@@ -32,6 +75,60 @@ def load_config():
     config = Config()
     config.linkedin_email = os.getenv('LINKEDIN_EMAIL', '')
     config.linkedin_password = os.getenv('LINKEDIN_PASSWORD', '')
+    config.linkedin_base_url = os.getenv('LINKEDIN_BASE_URL', config.linkedin_base_url).rstrip('/')
     config.headless_browser = os.getenv('HEADLESS_BROWSER', 'False').lower() == 'true'
+    config.reuse_session = os.getenv('REUSE_SESSION', 'True').lower() == 'true'
+    config.session_cookies_file = os.getenv('SESSION_COOKIES_FILE', config.session_cookies_file)
+    config.chrome_profile_dir = os.getenv('CHROME_PROFILE_DIR', config.chrome_profile_dir)
+    config.driver_cache_file = os.getenv('DRIVER_CACHE_FILE', config.driver_cache_file)
+    config.prewarm_browser = os.getenv('PREWARM_BROWSER', 'False').lower() == 'true'
+    config.incremental_crawl = os.getenv('INCREMENTAL_CRAWL', 'True').lower() == 'true'
+    config.max_job_retries = int(os.getenv('MAX_JOB_RETRIES', config.max_job_retries))
+    config.search_workers = int(os.getenv('SEARCH_WORKERS', config.search_workers))
+    config.enrichment_workers = int(os.getenv('ENRICHMENT_WORKERS', config.enrichment_workers))
+    config.enrichment_worker_delay = float(os.getenv('ENRICHMENT_WORKER_DELAY', config.enrichment_worker_delay))
+    config.pipeline_enrichment = os.getenv('PIPELINE_ENRICHMENT', 'False').lower() == 'true'
+    config.pipeline_queue_size = int(os.getenv('PIPELINE_QUEUE_SIZE', config.pipeline_queue_size))
+    config.detail_fetch_mode = os.getenv('DETAIL_FETCH_MODE', config.detail_fetch_mode).lower()
+    config.card_extraction_mode = os.getenv('CARD_EXTRACTION_MODE', config.card_extraction_mode).lower()
+    config.min_request_delay = float(os.getenv('MIN_REQUEST_DELAY', config.min_request_delay))
+    config.max_request_delay = float(os.getenv('MAX_REQUEST_DELAY', config.max_request_delay))
+    config.request_jitter = float(os.getenv('REQUEST_JITTER', config.request_jitter))
+    config.throttle_backoff = float(os.getenv('THROTTLE_BACKOFF', config.throttle_backoff))
+    config.block_resources = os.getenv('BLOCK_RESOURCES', config.block_resources).lower()
+    config.resource_allow_patterns = os.getenv('RESOURCE_ALLOW_PATTERNS', config.resource_allow_patterns)
+    config.metrics_json_file = os.getenv('METRICS_JSON_FILE', config.metrics_json_file)
+    config.metrics_prometheus_file = os.getenv('METRICS_PROMETHEUS_FILE', config.metrics_prometheus_file)
+    config.metrics_port = int(os.getenv('METRICS_PORT', config.metrics_port))
+    config.log_level = os.getenv('LOG_LEVEL', config.log_level).lower()
+    config.log_sink = os.getenv('LOG_SINK', config.log_sink).lower()
+    config.log_file = os.getenv('LOG_FILE', config.log_file)
+    config.debug_log_rate = float(os.getenv('DEBUG_LOG_RATE', config.debug_log_rate))
+    config.daemon_searches_file = os.getenv('DAEMON_SEARCHES_FILE', config.daemon_searches_file)
+    config.daemon_interval_minutes = float(os.getenv('DAEMON_INTERVAL_MINUTES', config.daemon_interval_minutes))
+    config.daemon_jitter = float(os.getenv('DAEMON_JITTER', config.daemon_jitter))
+    config.daemon_browser_max_age_hours = float(os.getenv('DAEMON_BROWSER_MAX_AGE_HOURS', config.daemon_browser_max_age_hours))
+    
+    return config
+
+def filters_from_dict(entry: dict) -> SearchFilters:
+    # Unknown keys are ignored so stored filters survive new or removed fields
+    fields = SearchFilters.__dataclass_fields__
+    return SearchFilters(**{key: value for key, value in entry.items() if key in fields})
+
+def load_search_queries(path: str) -> List[SearchFilters]:
+    # A JSON list of objects using the SearchFilters field names
+    with open(path, 'r') as f:
+        entries = json.load(f)
+    
+    return [filters_from_dict(entry) for entry in entries]
+
+def load_saved_searches(path: str, default_interval: float = 60.0) -> List[SavedSearch]:
+    # Same format as load_search_queries, plus optional interval_minutes and enabled per entry
+    with open(path, 'r') as f:
+        entries = json.load(f)
     
-    return config
\ No newline at end of file
+    return [SavedSearch(filters=filters_from_dict(entry),
+                        interval_minutes=float(entry.get('interval_minutes', default_interval)),
+                        enabled=bool(entry.get('enabled', True)))
+            for entry in entries]
\ No newline at end of file
@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from config import Config, filters_from_dict, load_saved_searches
+from database import JobDatabase
+from dedup import DedupIndex
+from linkedin_automation import LinkedInAutomation
+from metrics import REGISTRY
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+DAEMON_RUNS_TOTAL = "linkedin_daemon_runs_total"
+
+# Longest sleep between schedule checks, so searches added to the database are picked up
+POLL_SECONDS = 60.0
+
+class CrawlDaemon:
+    # Runs the saved searches in jobs.db indefinitely on one long-lived, logged-in
+    # browser. A search is due interval_minutes (+/- daemon_jitter) after its last
+    # run; the schedule lives in the database, so a restart picks up where it was.
+    def __init__(self, config: Config, db: Optional[JobDatabase] = None, searches_file: str = ""):
+        self.config = config
+        self._owns_db = db is None
+        self.db = db if db is not None else JobDatabase()
+        self.searches_file = searches_file or config.daemon_searches_file
+        self.automation = None
+        self.dedup = None
+        self._browser_started = 0.0
+        self._stopped = threading.Event()
+    
+    def load_searches_file(self) -> int:
+        if not self.searches_file:
+            return 0
+        
+        searches = load_saved_searches(self.searches_file, self.config.daemon_interval_minutes)
+        for search in searches:
+            self.db.save_saved_search(asdict(search.filters), search.interval_minutes, search.enabled)
+        logger.info("Loaded %s saved searches from %s", len(searches), self.searches_file)
+        return len(searches)
+    
+    def next_run_after(self, interval_minutes: float) -> datetime:
+        # Jittered so runs don't land on a fixed beat
+        spread = random.uniform(1 - self.config.daemon_jitter, 1 + self.config.daemon_jitter)
+        return datetime.now() + timedelta(minutes=interval_minutes * spread)
+    
+    def next_due(self, searches: List[Dict]) -> Tuple[Dict, float]:
+        # The search due first and how many seconds until then; never-run searches are due now
+        now = datetime.now()
+        
+        def due_at(search):
+            if not search["next_run_date"]:
+                return now
+            return datetime.fromisoformat(search["next_run_date"])
+        
+        search = min(searches, key=due_at)
+        return search, max(0.0, (due_at(search) - now).total_seconds())
+    
+    def _browser_expired(self) -> bool:
+        max_age = self.config.daemon_browser_max_age_hours * 3600
+        return max_age > 0 and time.monotonic() - self._browser_started > max_age
+    
+    def ensure_browser(self) -> bool:
+        # Keeps the running browser; starts and logs in a new one when it died or is due for a restart
+        if self.automation is not None:
+            if self._browser_expired():
+                logger.info("Restarting the browser after %.1f hours", self.config.daemon_browser_max_age_hours)
+                self.close_browser()
+            else:
+                try:
+                    self.automation.driver.current_url
+                    return True
+                except Exception:
+                    logger.warning("Browser stopped responding, starting a new one")
+                    self.close_browser()
+        
+        # Reloaded with every new browser to include jobs other processes saved meanwhile
+        self.dedup = DedupIndex(self.db, max_exact_keys=self.config.dedup_max_exact_keys).load()
+        try:
+            self.automation = LinkedInAutomation(self.config, db=self.db, dedup=self.dedup)
+        except Exception as e:
+            logger.error("Could not start a browser: %s", e)
+            return False
+        self._browser_started = time.monotonic()
+        
+        if not self.automation.login():
+            logger.error("Login failed")
+            self.close_browser()
+            return False
+        return True
+    
+    def run_search(self, search: Dict) -> Dict:
+        filters = filters_from_dict(search["filters"])
+        started = datetime.now()
+        logger.info("Running saved search %s: %s (%s)", search["id"], filters.job_title, filters.location)
+        
+        # resume=True continues a crawl of this search cut short by a crash or restart
+        jobs = self.automation.search_jobs(filters, resume=True)
+        stats = dict(self.automation.last_search_stats)
+        result = "success"
+        if not jobs and not self.automation.is_logged_in():
+            # An expired session shows up as an empty search; log in before the next run
+            logger.warning("LinkedIn session expired, logging in again")
+            result = "session_expired"
+            if not self.automation.login():
+                self.close_browser()
+        
+        next_run = self.next_run_after(search["interval_minutes"])
+        self.db.update_saved_search_run(search["id"], started.isoformat(), next_run.isoformat())
+        REGISTRY.counter(DAEMON_RUNS_TOTAL, "Saved search runs by the daemon").inc(result=result)
+        logger.info("Saved search %s: %s jobs saved, next run at %s", search["id"],
+                    stats.get("jobs_saved", 0), next_run.strftime("%Y-%m-%d %H:%M"))
+        return stats
+    
+    def run(self):
+        self.load_searches_file()
+        failures = 0
+        logger.info("Daemon started")
+        
+        try:
+            while not self._stopped.is_set():
+                searches = self.db.get_saved_searches()
+                if not searches:
+                    logger.warning("No saved searches to run, checking again in %ss", int(POLL_SECONDS))
+                    self._stopped.wait(POLL_SECONDS)
+                    continue
+                
+                search, wait_seconds = self.next_due(searches)
+                if wait_seconds > 0:
+                    self._stopped.wait(min(wait_seconds, POLL_SECONDS))
+                    continue
+                
+                if not self.ensure_browser():
+                    # Back off so a broken login isn't retried against LinkedIn in a tight loop
+                    failures += 1
+                    delay = min(3600, POLL_SECONDS * 2 ** (failures - 1))
+                    logger.warning("Trying to start the browser again in %ss", int(delay))
+                    self._stopped.wait(delay)
+                    continue
+                
+                failures = 0
+                try:
+                    self.run_search(search)
+                except Exception as e:
+                    # Start over with a fresh browser instead of ending the daemon
+                    logger.error("Saved search %s failed: %s", search["id"], e)
+                    self.close_browser()
+                    self._stopped.wait(POLL_SECONDS)
+        finally:
+            self.close()
+        logger.info("Daemon stopped")
+    
+    def stop(self):
+        # Takes effect once the running search finishes
+        self._stopped.set()
+    
+    def close_browser(self):
+        if self.automation is not None:
+            try:
+                self.automation.close()
+            except Exception:
+                pass
+            self.automation = None
+    
+    def close(self):
+        self.close_browser()
+        if self._owns_db:
+            self.db.close()
@@ -1,144 +1,813 @@
 import sqlite3
+import threading
 import json
+import zlib
 from datetime import datetime
 from typing import List, Dict, Optional
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+JOB_COLUMNS = ['id', 'job_title', 'company_name', 'location', 'job_url', 
+               'application_url', 'job_description', 'salary_range', 
+               'experience_level', 'employment_type', 'posted_date', 
+               'scraped_date', 'applied', 'applied_date', 'status']
+
+# job_description lives in job_descriptions; this expression reads it back for a jobs row
+DESCRIPTION_SQL = '(SELECT job_text(body, compression) FROM job_descriptions WHERE job_id = jobs.id)'
+
+def select_columns(columns: List[str]) -> str:
+    unknown = [column for column in columns if column not in JOB_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown job columns: {unknown}")
+    return ', '.join(
+        f'{DESCRIPTION_SQL} AS job_description' if column == 'job_description' else f'jobs.{column}'
+        for column in columns
+    )
+
+# Columns shown in the Job Listings table
+LISTING_COLUMNS = ['id', 'job_title', 'company_name', 'location', 'posted_date', 'applied', 'status']
+
+# bm25 weights for job_title, company_name, location, job_description
+FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)')
+        conn.execute('DROP TABLE temp.fts5_probe')
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+def _create_jobs_fts(conn: sqlite3.Connection):
+    if not fts5_available(conn):
+        logger.warning("SQLite was built without FTS5, job search will fall back to LIKE queries")
+        return
+    
+    # External-content table: the text lives in jobs, the index in jobs_fts
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            job_title, company_name, location, job_description,
+            content='jobs', content_rowid='id', tokenize='porter unicode61'
+        )
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, job_title, company_name, location, job_description)
+            VALUES (new.id, new.job_title, new.company_name, new.location, new.job_description);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, location, job_description)
+            VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.job_description);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+        AFTER UPDATE OF job_title, company_name, location, job_description ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, location, job_description)
+            VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.job_description);
+            INSERT INTO jobs_fts (rowid, job_title, company_name, location, job_description)
+            VALUES (new.id, new.job_title, new.company_name, new.location, new.job_description);
+        END
+    ''')
+    conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Descriptions shorter than this are stored as plain text; compressing them saves nothing
+COMPRESS_MIN_BYTES = 256
+
+def encode_description(text: Optional[str], compression: str = "zlib") -> tuple:
+    # Returns (compression, body) for the job_descriptions table
+    if not text:
+        return "", text
+    raw = text.encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES or not compression:
+        return "", text
+    if compression == "zstd" and zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=9).compress(raw)
+    return "zlib", zlib.compress(raw, 6)
+
+def decode_description(body, compression: Optional[str]) -> Optional[str]:
+    if body is None or not compression:
+        return body
+    if compression == "zlib":
+        return zlib.decompress(body).decode("utf-8")
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed descriptions")
+        return zstandard.ZstdDecompressor().decompress(body).decode("utf-8")
+    raise ValueError(f"Unknown description compression: {compression}")
+
+def _move_descriptions_out(conn: sqlite3.Connection):
+    # Descriptions are read only when a job is opened, so they get their own
+    # (compressed) table and listing queries never page them in
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_descriptions (
+            job_id INTEGER PRIMARY KEY,
+            compression TEXT NOT NULL DEFAULT '',
+            body BLOB
+        )
+    ''')
+    
+    rows = conn.execute(
+        "SELECT id, job_description FROM jobs WHERE job_description IS NOT NULL AND job_description != ''"
+    ).fetchall()
+    for job_id, description in rows:
+        compression, body = encode_description(description)
+        conn.execute('INSERT OR REPLACE INTO job_descriptions (job_id, compression, body) VALUES (?, ?, ?)',
+                     (job_id, compression, body))
+    
+    # The old column is kept for compatibility with older SQLite builds but no longer filled
+    for trigger in ('jobs_fts_insert', 'jobs_fts_delete', 'jobs_fts_update'):
+        conn.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    conn.execute('DROP TABLE IF EXISTS jobs_fts')
+    conn.execute('UPDATE jobs SET job_description = NULL WHERE job_description IS NOT NULL')
+    
+    # Deleting a job removes its description, whether or not FTS5 is available
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS job_descriptions_cleanup AFTER DELETE ON jobs BEGIN
+            DELETE FROM job_descriptions WHERE job_id = old.id;
+        END
+    ''')
+    
+    _create_search_index(conn)
+
+def _create_search_index(conn: sqlite3.Connection):
+    if not fts5_available(conn):
+        logger.warning("SQLite was built without FTS5, job search will fall back to LIKE queries")
+        return
+    
+    # Contentless: only the index is stored, the text stays in jobs and
+    # (compressed) in job_descriptions. There are no triggers - JobDatabase
+    # indexes and unindexes rows itself, since that needs the decoded description.
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            job_title, company_name, location, job_description,
+            content='', tokenize='porter unicode61'
+        )
+    ''')
+    _index_jobs(conn, _indexed_rows(conn))
+
+def _indexed_rows(conn: sqlite3.Connection, where: str = '1', params: tuple = ()) -> List[tuple]:
+    # (id, job_title, company_name, location, job_description) as jobs_fts indexes them
+    rows = conn.execute(f'''
+        SELECT jobs.id, jobs.job_title, jobs.company_name, jobs.location, d.body, d.compression
+        FROM jobs LEFT JOIN job_descriptions d ON d.job_id = jobs.id
+        WHERE {where}
+    ''', params).fetchall()
+    return [(job_id, title, company, location, decode_description(body, compression))
+            for job_id, title, company, location, body, compression in rows]
+
+def _index_jobs(conn: sqlite3.Connection, rows: List[tuple]):
+    conn.executemany(
+        'INSERT INTO jobs_fts (rowid, job_title, company_name, location, job_description) VALUES (?, ?, ?, ?, ?)',
+        rows
+    )
+
+def _unindex_jobs(conn: sqlite3.Connection, rows: List[tuple]):
+    # A contentless index can only drop a row given the exact values it indexed
+    conn.executemany('''
+        INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, location, job_description)
+        VALUES ('delete', ?, ?, ?, ?, ?)
+    ''', rows)
+
+SNIPPET_WORDS = 12
+
+def make_snippet(text: Optional[str], query: str, words: int = SNIPPET_WORDS) -> str:
+    # Stand-in for FTS5 snippet(), which a contentless index can't produce:
+    # the window of the description with the most query matches, matches in [brackets]
+    if not text:
+        return ''
+    terms = [term.lower() for term in query.split()]
+    tokens = text.split()
+    hits = [any(token.strip('.,;:!?()[]"\'').lower().startswith(term) for term in terms) for token in tokens]
+    
+    start = max(range(max(1, len(tokens) - words + 1)), key=lambda i: sum(hits[i:i + words]))
+    shown = [f'[{token}]' if hit else token
+             for token, hit in zip(tokens[start:start + words], hits[start:start + words])]
+    prefix = '…' if start > 0 else ''
+    suffix = '…' if start + words < len(tokens) else ''
+    return prefix + ' '.join(shown) + suffix
+
+def build_fts_query(text: str) -> str:
+    # Quote every term so user input can't hit FTS5 syntax errors ("C++", "R&D", ...);
+    # the last term is a prefix match for search-as-you-type
+    terms = [term.replace('"', '""') for term in text.split()]
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return " ".join(quoted)
+
+# Schema migrations, applied in order and tracked with PRAGMA user_version.
+# Never edit a released entry - append a new one so existing jobs.db files upgrade in place.
+MIGRATIONS = [
+    # 1: job_exists_by_details and clear_duplicates look up and group by this triple
+    [
+        'CREATE INDEX IF NOT EXISTS idx_jobs_details ON jobs (job_title, company_name, location)',
+    ],
+    # 2: listing order used by get_all_jobs
+    [
+        'CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs (scraped_date)',
+    ],
+    # 3: change watermark checked by the GUI before refreshing the listing
+    [
+        'CREATE INDEX IF NOT EXISTS idx_jobs_applied_date ON jobs (applied_date)',
+    ],
+    # 4: per-query high-water marks so repeat searches stop at already crawled results
+    [
+        '''CREATE TABLE IF NOT EXISTS search_marks (
+            query_key TEXT PRIMARY KEY,
+            newest_posted_date TEXT,
+            seen_job_ids TEXT NOT NULL DEFAULT '[]',
+            updated_date TEXT
+        )''',
+    ],
+    # 5: full-text index over the searchable job text, kept in sync by triggers
+    [
+        _create_jobs_fts,
+    ],
+    # 6: descriptions move to the compressed job_descriptions side table and
+    # the full-text index becomes contentless
+    [
+        _move_descriptions_out,
+    ],
+    # 7: resumable crawls - where each query's paging got to, and the cards found
+    # but not yet enriched (with their failed attempts)
+    [
+        '''CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+            query_key TEXT PRIMARY KEY,
+            search_url TEXT NOT NULL,
+            filters TEXT NOT NULL DEFAULT '{}',
+            next_page INTEGER NOT NULL DEFAULT 1,
+            jobs_saved INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'running',
+            started_date TEXT,
+            updated_date TEXT
+        )''',
+        '''CREATE TABLE IF NOT EXISTS pending_jobs (
+            job_url TEXT PRIMARY KEY,
+            query_key TEXT,
+            job_data TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            added_date TEXT,
+            updated_date TEXT
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_pending_jobs_query ON pending_jobs (query_key, attempts)',
+    ],
+    # 8: searches the daemon runs on a schedule
+    [
+        '''CREATE TABLE IF NOT EXISTS saved_searches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            search_key TEXT UNIQUE NOT NULL,
+            filters TEXT NOT NULL,
+            interval_minutes REAL NOT NULL,
+            enabled BOOLEAN NOT NULL DEFAULT 1,
+            last_run_date TEXT,
+            next_run_date TEXT,
+            created_date TEXT
+        )''',
+    ],
+]
+
+# Migrations that free a lot of pages; the file only shrinks after a VACUUM
+VACUUM_AFTER_MIGRATIONS = {6}
+
+CHECKPOINT_COLUMNS = ['query_key', 'search_url', 'filters', 'next_page', 'jobs_saved',
+                      'status', 'started_date', 'updated_date']
+
+SAVED_SEARCH_COLUMNS = ['id', 'filters', 'interval_minutes', 'enabled', 'last_run_date', 'next_run_date']
 
 class JobDatabase:
-    def __init__(self, db_path: str = "jobs.db"):
+    def __init__(self, db_path: str = "jobs.db", timeout: float = 30.0, description_compression: str = "zlib"):
         self.db_path = db_path
+        self.timeout = timeout
+        self.description_compression = description_compression
+        self._local = threading.local()
+        # Open connections by owning thread, so those of finished threads can be closed
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        # SQLite allows a single writer at a time; serialising writes here keeps
+        # the GUI and search threads from tripping over "database is locked".
+        self._write_lock = threading.RLock()
+        # Bumped on every write through this instance so caches (e.g. the GUI row model) can invalidate
+        self.write_version = 0
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={int(self.timeout * 1000)}')
+        # INSERT OR REPLACE only fires the delete triggers (dropping the old description) with this on
+        conn.execute('PRAGMA recursive_triggers=ON')
+        # Used by queries that read compressed descriptions; never by triggers or views,
+        # which other SQLite clients have to be able to run
+        conn.create_function('job_text', 2, decode_description, deterministic=True)
+        return conn
+    
+    def get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                # Threads that exited without release_thread_connection() leave theirs behind
+                for thread in [thread for thread in self._connections if not thread.is_alive()]:
+                    self._close_connection(self._connections.pop(thread))
+                self._connections[threading.current_thread()] = conn
+        return conn
+    
+    def _close_connection(self, conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except sqlite3.ProgrammingError:
+            pass
+    
+    def release_thread_connection(self):
+        # Worker threads call this in a finally so their connection doesn't outlive them
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._connections_lock:
+            self._connections.pop(threading.current_thread(), None)
+        self._close_connection(conn)
+    
+    def close(self):
+        with self._connections_lock:
+            connections, self._connections = list(self._connections.values()), {}
+        for conn in connections:
+            self._close_connection(conn)
+        self._local = threading.local()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def init_database(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_title TEXT NOT NULL,
-                company_name TEXT NOT NULL,
-                location TEXT,
-                job_url TEXT UNIQUE NOT NULL,
-                application_url TEXT,
-                job_description TEXT,
-                salary_range TEXT,
-                experience_level TEXT,
-                employment_type TEXT,
-                posted_date TEXT,
-                scraped_date TEXT,
-                applied BOOLEAN DEFAULT FALSE,
-                applied_date TEXT,
-                status TEXT DEFAULT 'found'
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        conn = self.get_connection()
+        
+        with self._write_lock, conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_title TEXT NOT NULL,
+                    company_name TEXT NOT NULL,
+                    location TEXT,
+                    job_url TEXT UNIQUE NOT NULL,
+                    application_url TEXT,
+                    job_description TEXT,
+                    salary_range TEXT,
+                    experience_level TEXT,
+                    employment_type TEXT,
+                    posted_date TEXT,
+                    scraped_date TEXT,
+                    applied BOOLEAN DEFAULT FALSE,
+                    applied_date TEXT,
+                    status TEXT DEFAULT 'found'
+                )
+            ''')
+        
+        self.migrate()
+    
+    def schema_version(self) -> int:
+        return self.get_connection().execute('PRAGMA user_version').fetchone()[0]
+    
+    def migrate(self):
+        conn = self.get_connection()
+        
+        with self._write_lock:
+            current = self.schema_version()
+            applied = []
+            for version, statements in enumerate(MIGRATIONS, start=1):
+                if version <= current:
+                    continue
+                
+                # Each migration commits atomically together with its version bump
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    # Another process starting at the same time may have applied it while we waited for the lock
+                    if self.schema_version() >= version:
+                        conn.execute('COMMIT')
+                        continue
+                    for statement in statements:
+                        if callable(statement):
+                            statement(conn)
+                        else:
+                            conn.execute(statement)
+                    conn.execute(f'PRAGMA user_version = {version}')
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+                
+                applied.append(version)
+                logger.info("Applied database migration %s", version)
+            
+            if applied:
+                if VACUUM_AFTER_MIGRATIONS.intersection(applied):
+                    logger.info("Compacting the database file...")
+                    conn.execute('VACUUM')
+                conn.execute('ANALYZE')
     
     def add_job(self, job_data: Dict) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self.get_connection()
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO jobs 
-                (job_title, company_name, location, job_url, application_url, 
-                 job_description, salary_range, experience_level, employment_type, 
-                 posted_date, scraped_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data.get('job_title'),
-                job_data.get('company_name'),
-                job_data.get('location'),
-                job_data.get('job_url'),
-                job_data.get('application_url'),
-                job_data.get('job_description'),
-                job_data.get('salary_range'),
-                job_data.get('experience_level'),
-                job_data.get('employment_type'),
-                job_data.get('posted_date'),
-                datetime.now().isoformat()
-            ))
+            with self._write_lock, conn:
+                indexed = self.has_fts()
+                if indexed:
+                    # A re-scraped job replaces its old row, so its old index entry goes first
+                    _unindex_jobs(conn, _indexed_rows(conn, 'jobs.job_url = ?', (job_data.get('job_url'),)))
+                
+                cursor = conn.execute('''
+                    INSERT OR REPLACE INTO jobs 
+                    (job_title, company_name, location, job_url, application_url, 
+                     salary_range, experience_level, employment_type, 
+                     posted_date, scraped_date)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    job_data.get('job_title'),
+                    job_data.get('company_name'),
+                    job_data.get('location'),
+                    job_data.get('job_url'),
+                    job_data.get('application_url'),
+                    job_data.get('salary_range'),
+                    job_data.get('experience_level'),
+                    job_data.get('employment_type'),
+                    job_data.get('posted_date'),
+                    datetime.now().isoformat()
+                ))
+                
+                if job_data.get('job_description'):
+                    compression, body = encode_description(job_data['job_description'], self.description_compression)
+                    conn.execute('''
+                        INSERT INTO job_descriptions (job_id, compression, body) VALUES (?, ?, ?)
+                        ON CONFLICT (job_id) DO UPDATE SET compression = excluded.compression, body = excluded.body
+                    ''', (cursor.lastrowid, compression, body))
+                if indexed:
+                    _index_jobs(conn, [(cursor.lastrowid, job_data.get('job_title'), job_data.get('company_name'),
+                                        job_data.get('location'), job_data.get('job_description') or None)])
+                self.write_version += 1
             
-            conn.commit()
             return True
-            
+        
         except sqlite3.IntegrityError:
             return False
-        finally:
-            conn.close()
     
-    def get_all_jobs(self) -> List[Dict]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_all_jobs(self, columns: Optional[List[str]] = None) -> List[Dict]:
+        # Pass a column list to skip reading heavy fields such as job_description
+        # Prefer iter_jobs for anything that only needs to walk the rows once
+        return list(self.iter_jobs(columns=columns))
+    
+    def _where(self, filters: Optional[Dict]) -> tuple:
+        # Equality filters on job columns, e.g. {'applied': False, 'status': 'found'}
+        clauses = []
+        params = []
+        for column, value in (filters or {}).items():
+            if column not in JOB_COLUMNS or column == 'job_description':
+                raise ValueError(f"Cannot filter on column: {column}")
+            if value is None:
+                clauses.append(f'jobs.{column} IS NULL')
+            else:
+                clauses.append(f'jobs.{column} = ?')
+                params.append(value)
+        return clauses, params
+    
+    def fetch_jobs_page(self, columns: Optional[List[str]] = None, filters: Optional[Dict] = None,
+                        order: str = 'desc', limit: int = 500, after: Optional[tuple] = None) -> List[Dict]:
+        # One keyset page ordered by (scraped_date, id). `after` is the (scraped_date, id)
+        # of the last row of the previous page, so every page is an index seek, not an OFFSET scan.
+        if order not in ('asc', 'desc'):
+            raise ValueError("order must be 'asc' or 'desc'")
         
-        cursor.execute('SELECT * FROM jobs ORDER BY scraped_date DESC')
-        jobs = cursor.fetchall()
+        columns = list(columns or JOB_COLUMNS)
+        # The keyset needs both sort columns; they are stripped again unless requested
+        query_columns = columns + [column for column in ('scraped_date', 'id') if column not in columns]
         
-        conn.close()
+        clauses, params = self._where(filters)
+        if after is not None:
+            clauses.append('(jobs.scraped_date, jobs.id) ' + ('<' if order == 'desc' else '>') + ' (?, ?)')
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
         
-        columns = ['id', 'job_title', 'company_name', 'location', 'job_url', 
-                  'application_url', 'job_description', 'salary_range', 
-                  'experience_level', 'employment_type', 'posted_date', 
-                  'scraped_date', 'applied', 'applied_date', 'status']
+        cursor = self.get_connection().execute(f'''
+            SELECT {select_columns(query_columns)} FROM jobs {where}
+            ORDER BY jobs.scraped_date {order.upper()}, jobs.id {order.upper()}
+            LIMIT ?
+        ''', (*params, limit))
         
-        return [dict(zip(columns, job)) for job in jobs]
+        return [dict(zip(query_columns, row)) for row in cursor]
     
-    def job_exists(self, job_url: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def iter_jobs(self, filters: Optional[Dict] = None, order: str = 'desc', page_size: int = 500,
+                  columns: Optional[List[str]] = None):
+        # Streams jobs page by page; memory stays flat however large the table is
+        columns = list(columns or JOB_COLUMNS)
+        after = None
         
-        cursor.execute('SELECT id FROM jobs WHERE job_url = ?', (job_url,))
-        exists = cursor.fetchone() is not None
+        while True:
+            page = self.fetch_jobs_page(columns, filters, order, page_size, after)
+            for job in page:
+                yield {column: job[column] for column in columns}
+            if len(page) < page_size:
+                return
+            after = (page[-1]['scraped_date'], page[-1]['id'])
+    
+    def count_jobs(self, filters: Optional[Dict] = None) -> int:
+        clauses, params = self._where(filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self.get_connection().execute(f'SELECT COUNT(*) FROM jobs {where}', params).fetchone()[0]
+    
+    def latest_jobs(self, n: int, columns: Optional[List[str]] = None, filters: Optional[Dict] = None) -> List[Dict]:
+        columns = list(columns or JOB_COLUMNS)
+        page = self.fetch_jobs_page(columns, filters, 'desc', n)
+        return [{column: job[column] for column in columns} for job in page]
+    
+    def get_listing_page(self, limit: int, after: Optional[tuple] = None) -> List[Dict]:
+        # Rows keep scraped_date so the caller can pass the last one on as the next `after`
+        return self.fetch_jobs_page(LISTING_COLUMNS, None, 'desc', limit, after)
+    
+    def get_change_watermark(self) -> tuple:
+        # Changes whenever a job is added, removed, re-scraped or marked applied
+        # Separate subqueries let each MAX() read the end of its index
+        return self.get_connection().execute('''
+            SELECT (SELECT COUNT(*) FROM jobs),
+                   (SELECT MAX(scraped_date) FROM jobs),
+                   (SELECT MAX(applied_date) FROM jobs)
+        ''').fetchone()
+    
+    def has_fts(self) -> bool:
+        return self.get_connection().execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone() is not None
+    
+    def search(self, query: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+        # Ranked keyword search; returns listing columns plus a description snippet
+        fts_query = build_fts_query(query)
+        if not fts_query:
+            return []
         
-        conn.close()
-        return exists
+        columns = ', '.join(f'jobs.{column}' for column in LISTING_COLUMNS)
+        if self.has_fts():
+            # The join also drops index entries of jobs deleted by other SQLite clients
+            cursor = self.get_connection().execute(f'''
+                SELECT {columns}, {DESCRIPTION_SQL}
+                FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+                WHERE jobs_fts MATCH ?
+                ORDER BY bm25(jobs_fts, ?, ?, ?, ?)
+                LIMIT ? OFFSET ?
+            ''', (fts_query, *FTS_WEIGHTS, limit, offset))
+            return [dict(zip(LISTING_COLUMNS, row[:-1]), snippet=make_snippet(row[-1], query)) for row in cursor]
+        
+        pattern, params = self._like_search(query)
+        cursor = self.get_connection().execute(f'''
+            SELECT {columns}, '' FROM jobs WHERE {pattern}
+            ORDER BY scraped_date DESC LIMIT ? OFFSET ?
+        ''', (*params, limit, offset))
+        return [dict(zip(LISTING_COLUMNS + ['snippet'], row)) for row in cursor]
     
-    def job_exists_by_details(self, job_title: str, company_name: str, location: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def count_search(self, query: str) -> int:
+        fts_query = build_fts_query(query)
+        if not fts_query:
+            return 0
+        
+        if self.has_fts():
+            return self.get_connection().execute(
+                'SELECT COUNT(*) FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid WHERE jobs_fts MATCH ?',
+                (fts_query,)
+            ).fetchone()[0]
         
-        cursor.execute('''
+        pattern, params = self._like_search(query)
+        return self.get_connection().execute(f'SELECT COUNT(*) FROM jobs WHERE {pattern}', params).fetchone()[0]
+    
+    def _like_search(self, query: str) -> tuple:
+        clauses = []
+        params = []
+        for term in query.split():
+            clauses.append(f'(job_title LIKE ? OR company_name LIKE ? OR location LIKE ? OR {DESCRIPTION_SQL} LIKE ?)')
+            params.extend([f'%{term}%'] * 4)
+        return ' AND '.join(clauses), params
+    
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        cursor = self.get_connection().execute(
+            f'SELECT {select_columns(JOB_COLUMNS)} FROM jobs WHERE id = ?', (job_id,)
+        )
+        job = cursor.fetchone()
+        return dict(zip(JOB_COLUMNS, job)) if job else None
+    
+    def get_job_description(self, job_id: int) -> Optional[str]:
+        row = self.get_connection().execute(
+            'SELECT body, compression FROM job_descriptions WHERE job_id = ?', (job_id,)
+        ).fetchone()
+        return decode_description(*row) if row else None
+    
+    def job_exists(self, job_url: str) -> bool:
+        cursor = self.get_connection().execute('SELECT id FROM jobs WHERE job_url = ?', (job_url,))
+        return cursor.fetchone() is not None
+    
+    def job_exists_by_details(self, job_title: str, company_name: str, location: str) -> bool:
+        cursor = self.get_connection().execute('''
             SELECT id FROM jobs 
             WHERE job_title = ? AND company_name = ? AND location = ?
         ''', (job_title, company_name, location))
-        exists = cursor.fetchone() is not None
+        return cursor.fetchone() is not None
+    
+    def get_search_mark(self, query_key: str) -> Optional[Dict]:
+        row = self.get_connection().execute(
+            'SELECT newest_posted_date, seen_job_ids, updated_date FROM search_marks WHERE query_key = ?',
+            (query_key,)
+        ).fetchone()
+        if row is None:
+            return None
         
-        conn.close()
-        return exists
+        return {
+            'query_key': query_key,
+            'newest_posted_date': row[0],
+            'seen_job_ids': json.loads(row[1]),
+            'updated_date': row[2]
+        }
+    
+    def save_search_mark(self, query_key: str, newest_posted_date: Optional[str], seen_job_ids: List[str]):
+        conn = self.get_connection()
+        
+        with self._write_lock, conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO search_marks (query_key, newest_posted_date, seen_job_ids, updated_date)
+                VALUES (?, ?, ?, ?)
+            ''', (query_key, newest_posted_date, json.dumps(seen_job_ids), datetime.now().isoformat()))
+    
+    def _checkpoint_row(self, row) -> Dict:
+        checkpoint = dict(zip(CHECKPOINT_COLUMNS, row))
+        checkpoint['filters'] = json.loads(checkpoint['filters'])
+        return checkpoint
+    
+    def get_crawl_checkpoint(self, query_key: str) -> Optional[Dict]:
+        row = self.get_connection().execute(
+            f'SELECT {", ".join(CHECKPOINT_COLUMNS)} FROM crawl_checkpoints WHERE query_key = ?', (query_key,)
+        ).fetchone()
+        return self._checkpoint_row(row) if row else None
+    
+    def get_unfinished_checkpoints(self) -> List[Dict]:
+        cursor = self.get_connection().execute(
+            f"SELECT {', '.join(CHECKPOINT_COLUMNS)} FROM crawl_checkpoints "
+            f"WHERE status != 'done' ORDER BY updated_date"
+        )
+        return [self._checkpoint_row(row) for row in cursor]
+    
+    def save_crawl_checkpoint(self, query_key: str, search_url: str, filters: Dict, next_page: int,
+                              jobs_saved: int = 0, status: str = 'running',
+                              pending_jobs: Optional[List[Dict]] = None):
+        # The page's cards and the page counter are committed together, so a crash
+        # can never skip a page whose jobs were not queued for enrichment
+        conn = self.get_connection()
+        now = datetime.now().isoformat()
+        
+        with self._write_lock, conn:
+            conn.execute('''
+                INSERT INTO crawl_checkpoints
+                    (query_key, search_url, filters, next_page, jobs_saved, status, started_date, updated_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(query_key) DO UPDATE SET
+                    search_url = excluded.search_url, filters = excluded.filters,
+                    next_page = excluded.next_page, jobs_saved = excluded.jobs_saved,
+                    status = excluded.status, updated_date = excluded.updated_date,
+                    started_date = CASE WHEN crawl_checkpoints.status = 'done'
+                        THEN excluded.started_date ELSE crawl_checkpoints.started_date END
+            ''', (query_key, search_url, json.dumps(filters), next_page, jobs_saved, status, now, now))
+            
+            if pending_jobs:
+                conn.executemany('''
+                    INSERT OR IGNORE INTO pending_jobs (job_url, query_key, job_data, added_date, updated_date)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [(job['job_url'], query_key, json.dumps(job), now, now) for job in pending_jobs])
+    
+    def get_pending_jobs(self, query_key: Optional[str] = None, max_attempts: Optional[int] = None) -> List[Dict]:
+        clauses = []
+        params = []
+        if query_key is not None:
+            clauses.append('query_key = ?')
+            params.append(query_key)
+        if max_attempts is not None:
+            clauses.append('attempts < ?')
+            params.append(max_attempts)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        
+        cursor = self.get_connection().execute(
+            f'SELECT job_data, attempts, last_error FROM pending_jobs {where} ORDER BY added_date', params
+        )
+        jobs = []
+        for job_data, attempts, last_error in cursor:
+            job = json.loads(job_data)
+            job['attempts'] = attempts
+            job['last_error'] = last_error
+            jobs.append(job)
+        return jobs
+    
+    def finish_pending_jobs(self, done_urls: List[str], failures: Optional[List[tuple]] = None):
+        # done_urls were stored or turned out to be duplicates; failures are (job_url, error)
+        if not done_urls and not failures:
+            return
+        
+        conn = self.get_connection()
+        now = datetime.now().isoformat()
+        with self._write_lock, conn:
+            conn.executemany('DELETE FROM pending_jobs WHERE job_url = ?', [(url,) for url in done_urls])
+            conn.executemany('''
+                UPDATE pending_jobs SET attempts = attempts + 1, last_error = ?, updated_date = ?
+                WHERE job_url = ?
+            ''', [(str(error)[:500], now, url) for url, error in failures or []])
+    
+    def save_saved_search(self, filters: Dict, interval_minutes: float, enabled: bool = True) -> int:
+        # The same filters always map to one row, so re-loading a searches file only updates it
+        search_key = json.dumps(filters, sort_keys=True)
+        conn = self.get_connection()
+        
+        with self._write_lock, conn:
+            conn.execute('''
+                INSERT INTO saved_searches (search_key, filters, interval_minutes, enabled, created_date)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(search_key) DO UPDATE SET
+                    interval_minutes = excluded.interval_minutes, enabled = excluded.enabled
+            ''', (search_key, json.dumps(filters), interval_minutes, enabled, datetime.now().isoformat()))
+            return conn.execute('SELECT id FROM saved_searches WHERE search_key = ?', (search_key,)).fetchone()[0]
+    
+    def get_saved_searches(self, enabled_only: bool = True) -> List[Dict]:
+        where = 'WHERE enabled = 1' if enabled_only else ''
+        cursor = self.get_connection().execute(
+            f'SELECT {", ".join(SAVED_SEARCH_COLUMNS)} FROM saved_searches {where} ORDER BY id'
+        )
+        searches = []
+        for row in cursor:
+            search = dict(zip(SAVED_SEARCH_COLUMNS, row))
+            search['filters'] = json.loads(search['filters'])
+            search['enabled'] = bool(search['enabled'])
+            searches.append(search)
+        return searches
+    
+    def update_saved_search_run(self, search_id: int, last_run_date: Optional[str], next_run_date: str):
+        conn = self.get_connection()
+        
+        with self._write_lock, conn:
+            conn.execute('UPDATE saved_searches SET last_run_date = ?, next_run_date = ? WHERE id = ?',
+                         (last_run_date, next_run_date, search_id))
+    
+    def count_dedup_keys(self) -> int:
+        return self.get_connection().execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+    
+    def iter_dedup_keys(self):
+        # Streams rows instead of fetchall() so large databases load in constant memory
+        cursor = self.get_connection().execute(
+            'SELECT job_url, job_title, company_name, location FROM jobs'
+        )
+        for row in cursor:
+            yield row
     
     def clear_duplicates(self) -> int:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self.get_connection()
         
         # Find and delete duplicate jobs (keeping the first occurrence)
-        cursor.execute('''
-            DELETE FROM jobs 
-            WHERE id NOT IN (
-                SELECT MIN(id) 
-                FROM jobs 
-                GROUP BY job_title, company_name, location
-            )
-        ''')
-        
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._write_lock, conn:
+            duplicates = 'jobs.id NOT IN (SELECT MIN(id) FROM jobs GROUP BY job_title, company_name, location)'
+            if self.has_fts():
+                _unindex_jobs(conn, _indexed_rows(conn, duplicates))
+            cursor = conn.execute(f'DELETE FROM jobs WHERE {duplicates}')
+            self.write_version += 1
         
-        return deleted_count
+        return cursor.rowcount
+    
+    def rebuild_search_index(self):
+        # Re-indexes every job; needed after job text was edited outside the app
+        if not self.has_fts():
+            return
+        conn = self.get_connection()
+        with self._write_lock, conn:
+            conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('delete-all')")
+            _index_jobs(conn, _indexed_rows(conn))
     
     def mark_applied(self, job_id: int) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE jobs 
-            SET applied = TRUE, applied_date = ?, status = 'applied'
-            WHERE id = ?
-        ''', (datetime.now().isoformat(), job_id))
+        conn = self.get_connection()
         
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
+        with self._write_lock, conn:
+            cursor = conn.execute('''
+                UPDATE jobs 
+                SET applied = TRUE, applied_date = ?, status = 'applied'
+                WHERE id = ?
+            ''', (datetime.now().isoformat(), job_id))
+            self.write_version += 1
         
-        return success
\ No newline at end of file
+        return cursor.rowcount > 0
\ No newline at end of file
@@ -0,0 +1,151 @@
+import hashlib
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from database import JobDatabase
+
+def _digest(*parts: Optional[str]) -> bytes:
+    key = "\x1f".join(parts).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(key, digest_size=16).digest()
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, digest: bytes) -> Iterable[int]:
+        # Kirsch-Mitzenmacher double hashing over the two halves of the digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, digest: bytes):
+        for pos in self._positions(digest):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
+# In-memory view of the URL and (title, company, location) keys already saved.
+# Keys are kept as 64-bit hashes in exact sets; past max_exact_keys the index
+# switches to Bloom filters and confirms every hit against SQLite, so a false
+# positive costs one query instead of silently dropping a new job.
+# One index may be shared by several crawler threads: filter_new() claims the
+# jobs it returns so two workers never enrich the same posting. Claims are kept
+# apart from the index in plain sets, since a Bloom hit is only trusted once
+# SQLite confirms it and a claimed job is not in SQLite yet.
+class DedupIndex:
+    def __init__(self, db: JobDatabase, max_exact_keys: int = 500000, error_rate: float = 0.001):
+        self.db = db
+        self.max_exact_keys = max_exact_keys
+        self.error_rate = error_rate
+        self.probabilistic = False
+        self._urls = set()
+        self._details = set()
+        self.loaded = False
+        self._claimed_urls = set()
+        self._claimed_details = set()
+        self._lock = threading.RLock()
+    
+    def load(self) -> "DedupIndex":
+        with self._lock:
+            return self._load()
+    
+    def _load(self) -> "DedupIndex":
+        total = self.db.count_dedup_keys()
+        self.probabilistic = total > self.max_exact_keys
+        
+        if self.probabilistic:
+            # Leave headroom for the jobs saved during this crawl
+            capacity = total * 2
+            self._urls = BloomFilter(capacity, self.error_rate)
+            self._details = BloomFilter(capacity, self.error_rate)
+        else:
+            self._urls = set()
+            self._details = set()
+        
+        for job_url, job_title, company_name, location in self.db.iter_dedup_keys():
+            self._add_keys(job_url, job_title, company_name, location)
+        
+        self.loaded = True
+        return self
+    
+    def _key(self, digest: bytes):
+        # Exact sets keep 8 bytes per key; the Bloom filters want all 16
+        return digest if self.probabilistic else int.from_bytes(digest[:8], "little")
+    
+    def _add_keys(self, job_url: Optional[str], job_title: Optional[str],
+                  company_name: Optional[str], location: Optional[str]):
+        if job_url:
+            self._urls.add(self._key(_digest(job_url)))
+        if None not in (job_title, company_name, location):
+            self._details.add(self._key(_digest(job_title, company_name, location)))
+    
+    def check(self, job: Dict) -> Optional[str]:
+        with self._lock:
+            return self._check(job)
+    
+    def _check(self, job: Dict) -> Optional[str]:
+        if not self.loaded:
+            self._load()
+        
+        job_url = job.get("job_url")
+        details = (job.get("job_title"), job.get("company_name"), job.get("location"))
+        if job_url and job_url in self._claimed_urls:
+            return "URL"
+        if None not in details and details in self._claimed_details:
+            return "details"
+        
+        if job_url and self._key(_digest(job_url)) in self._urls:
+            if not self.probabilistic or self.db.job_exists(job_url):
+                return "URL"
+        
+        job_title = job.get("job_title")
+        company_name = job.get("company_name")
+        location = job.get("location")
+        if None not in (job_title, company_name, location):
+            if self._key(_digest(job_title, company_name, location)) in self._details:
+                if not self.probabilistic or self.db.job_exists_by_details(job_title, company_name, location):
+                    return "details"
+        
+        return None
+    
+    def _claim(self, job: Dict, claimed: bool):
+        details = (job.get("job_title"), job.get("company_name"), job.get("location"))
+        if claimed:
+            self._claimed_urls.add(job.get("job_url"))
+            self._claimed_details.add(details)
+        else:
+            self._claimed_urls.discard(job.get("job_url"))
+            self._claimed_details.discard(details)
+    
+    def add(self, job: Dict):
+        # A saved job moves from the claims into the index
+        with self._lock:
+            self._add_keys(job.get("job_url"), job.get("job_title"),
+                           job.get("company_name"), job.get("location"))
+            self._claim(job, False)
+    
+    def release(self, job: Dict):
+        # Un-claims a job that could not be saved, so a later page may try it again
+        with self._lock:
+            self._claim(job, False)
+    
+    def filter_new(self, jobs: List[Dict]) -> Tuple[List[Dict], List[Tuple[Dict, str]]]:
+        new_jobs = []
+        duplicates = []
+        
+        with self._lock:
+            for job in jobs:
+                reason = self._check(job)
+                if reason:
+                    duplicates.append((job, reason))
+                else:
+                    # Claimed right away, which also catches cards repeated on the same page
+                    new_jobs.append(job)
+                    self._claim(job, True)
+        
+        return new_jobs, duplicates
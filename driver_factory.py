@@ -0,0 +1,287 @@
+import fnmatch
+import glob
+import json
+import os
+import stat
+import threading
+from typing import List, Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+from config import Config
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+# Chrome DevTools URL patterns (* wildcards) for each blockable resource type.
+# The automation only reads text and links, so none of these affect selectors.
+RESOURCE_BLOCK_PATTERNS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.bmp", "*.ico", "*.svg",
+               "*media.licdn.com/dms/image/*"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.ts", "*.mp3", "*.m4a", "*.ogg", "*.wav", "*.mov",
+              "*dms.licdn.com/playlist/*"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "stylesheets": ["*.css"],
+    "trackers": ["*google-analytics.com/*", "*googletagmanager.com/*", "*doubleclick.net/*",
+                 "*googlesyndication.com/*", "*facebook.net/*", "*connect.facebook.com/*",
+                 "*bat.bing.com/*", "*px.ads.linkedin.com/*", "*ads.linkedin.com/*",
+                 "*snap.licdn.com/li.lms-analytics/*", "*linkedin.com/li/track*",
+                 "*linkedin.com/sensorCollect*", "*hotjar.com/*", "*scorecardresearch.com/*"]
+}
+
+# Resolved chromedriver paths for this process, keyed by Chrome version
+_resolved_paths = {}
+_resolve_lock = threading.Lock()
+
+def detect_chrome_version() -> Optional[str]:
+    # Reads the locally installed Chrome version (a subprocess call, no network)
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+class DriverPathCache:
+    # Remembers which chromedriver matched which Chrome version so startup can
+    # skip webdriver-manager's version check and the recursive glob until Chrome
+    # is upgraded.
+    def __init__(self, path: str):
+        self.path = path
+    
+    def load(self) -> dict:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def get(self, chrome_version: Optional[str]) -> Optional[str]:
+        entry = self.load()
+        driver_path = entry.get("driver_path")
+        if not driver_path or entry.get("chrome_version") != chrome_version:
+            return None
+        if not os.access(driver_path, os.X_OK):
+            return None
+        return driver_path
+    
+    def store(self, chrome_version: Optional[str], driver_path: str):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "w") as f:
+                json.dump({"chrome_version": chrome_version, "driver_path": driver_path}, f)
+        except OSError as e:
+            logger.warning("Could not write driver cache %s: %s", self.path, e)
+    
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+def _install_chromedriver() -> str:
+    # Custom ChromeDriver setup to fix webdriver-manager bug
+    base_path = ChromeDriverManager().install()
+    base_dir = os.path.dirname(base_path)
+    
+    # Find the actual chromedriver executable
+    chromedriver_files = glob.glob(os.path.join(base_dir, "**/chromedriver"), recursive=True)
+    if not chromedriver_files:
+        raise Exception("Could not find chromedriver executable")
+    
+    driver_path = chromedriver_files[0]
+    logger.info("Found chromedriver at: %s", driver_path)
+    
+    # Make sure the driver is executable
+    os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
+    return driver_path
+
+def resolve_chromedriver_path(cache_file: str, refresh: bool = False) -> str:
+    chrome_version = detect_chrome_version()
+    cache = DriverPathCache(cache_file)
+    
+    with _resolve_lock:
+        if not refresh:
+            driver_path = _resolved_paths.get(chrome_version) or cache.get(chrome_version)
+            if driver_path:
+                _resolved_paths[chrome_version] = driver_path
+                return driver_path
+        
+        driver_path = _install_chromedriver()
+        _resolved_paths[chrome_version] = driver_path
+        cache.store(chrome_version, driver_path)
+        return driver_path
+
+def invalidate_chromedriver_cache(cache_file: str):
+    with _resolve_lock:
+        _resolved_paths.clear()
+        DriverPathCache(cache_file).clear()
+
+def parse_resource_list(value: str) -> List[str]:
+    items = [item.strip().lower() for item in (value or "").split(",") if item.strip()]
+    unknown = [item for item in items if item not in RESOURCE_BLOCK_PATTERNS]
+    if unknown:
+        raise ValueError(f"Unknown resource types to block: {unknown}")
+    return items
+
+def blocked_url_patterns(config: Config) -> List[str]:
+    allow_patterns = [pattern.strip() for pattern in config.resource_allow_patterns.split(",") if pattern.strip()]
+    patterns = []
+    for resource_type in parse_resource_list(config.block_resources):
+        patterns.extend(RESOURCE_BLOCK_PATTERNS[resource_type])
+    
+    # DevTools blocking has no exceptions, so an allow pattern lifts every block
+    # pattern it overlaps with (e.g. "*.svg" or "*media.licdn.com/dms/image/*")
+    return [
+        pattern for pattern in patterns
+        if not any(fnmatch.fnmatchcase(pattern, allow) or fnmatch.fnmatchcase(allow, pattern)
+                   for allow in allow_patterns)
+    ]
+
+def apply_resource_blocking(driver, config: Config) -> int:
+    patterns = blocked_url_patterns(config)
+    if not patterns:
+        return 0
+    
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        # Not fatal: pages still load, just with every asset
+        logger.warning("Could not enable resource blocking: %s", e)
+        return 0
+    
+    logger.debug("Blocking %s URL patterns: %s", len(patterns), patterns)
+    return len(patterns)
+
+def build_chrome_options(config: Config, use_profile: bool = False) -> Options:
+    chrome_options = Options()
+    
+    if config.headless_browser:
+        chrome_options.add_argument("--headless")
+    
+    # Without allow patterns, images are also switched off in the renderer, which
+    # skips decoding entirely; network blocking is applied once the driver is up
+    if "images" in parse_resource_list(config.block_resources) and not config.resource_allow_patterns.strip():
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
+    # Only the main browser gets the persistent profile; Chrome locks it per process
+    if use_profile and config.chrome_profile_dir:
+        profile_dir = os.path.abspath(config.chrome_profile_dir)
+        os.makedirs(profile_dir, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    return chrome_options
+
+def _start_chrome(chrome_options: Options, config: Config, driver_path: Optional[str] = None):
+    if driver_path:
+        driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    else:
+        driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    apply_resource_blocking(driver, config)
+    return driver
+
+def create_chrome_driver(config: Config, use_profile: bool = False):
+    chrome_options = build_chrome_options(config, use_profile)
+    
+    try:
+        driver_path = resolve_chromedriver_path(config.driver_cache_file)
+        try:
+            return _start_chrome(chrome_options, config, driver_path)
+        except Exception as e:
+            # A cached driver no longer matching Chrome: resolve again once
+            logger.warning("Cached chromedriver failed to start (%s), resolving again...", e)
+            invalidate_chromedriver_cache(config.driver_cache_file)
+            driver_path = resolve_chromedriver_path(config.driver_cache_file, refresh=True)
+            return _start_chrome(chrome_options, config, driver_path)
+            
+    except Exception as e:
+        logger.error("Error setting up ChromeDriver: %s", e)
+        try:
+            # Fallback: try system Chrome installation
+            logger.info("Trying system Chrome installation...")
+            return _start_chrome(chrome_options, config)
+        except Exception as e2:
+            logger.error("System Chrome also failed: %s", e2)
+            raise Exception("Could not initialize ChromeDriver")
+
+def _driver_key(config: Config, use_profile: bool) -> tuple:
+    # Settings baked into a started browser; a warm driver is only reused if they match
+    return (config.headless_browser, config.chrome_profile_dir if use_profile else "",
+            config.block_resources, config.resource_allow_patterns)
+
+class WarmDriver:
+    # Starts a Chrome instance in the background so the next search can take an
+    # already running browser instead of paying the cold start.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._driver = None
+        self._key = None
+    
+    def prewarm(self, config: Config, use_profile: bool = True):
+        with self._lock:
+            if self._thread is not None or self._driver is not None:
+                return
+            key = _driver_key(config, use_profile)
+            self._key = key
+            self._thread = threading.Thread(
+                target=self._start, args=(config, use_profile, key), name="warm-driver", daemon=True
+            )
+            self._thread.start()
+    
+    def _start(self, config: Config, use_profile: bool, key: tuple):
+        try:
+            driver = create_chrome_driver(config, use_profile)
+        except Exception as e:
+            logger.warning("Could not pre-start browser: %s", e)
+            driver = None
+        
+        with self._lock:
+            self._thread = None
+            if self._key == key:
+                self._driver = driver
+                return
+        # Settings changed while this browser was starting
+        if driver is not None:
+            driver.quit()
+    
+    def take(self, config: Config, use_profile: bool = True, timeout: float = 30.0):
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        
+        with self._lock:
+            driver, key = self._driver, self._key
+            self._driver = None
+            self._key = None
+        
+        if driver is None:
+            return None
+        if key != _driver_key(config, use_profile):
+            driver.quit()
+            return None
+        
+        try:
+            # Make sure the pre-started browser is still alive
+            driver.current_url
+        except Exception:
+            return None
+        return driver
+    
+    def close(self):
+        with self._lock:
+            driver = self._driver
+            self._driver = None
+            self._key = None
+        if driver is not None:
+            driver.quit()
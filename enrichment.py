@@ -0,0 +1,117 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from rate_limiter import RateLimiter
+from metrics import MetricsRegistry, REGISTRY, record_sleep
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+class EnrichmentPool:
+    # Fetches job details on several browser instances at once. Each worker owns
+    # its driver (WebDriver sessions are not thread-safe); results are handed back
+    # to the caller, which stays the single database writer. fetch_details gets a
+    # driver_provider rather than a driver, so a worker only starts Chrome once a
+    # fetch actually needs it (e.g. an HTTP fetch falling back to the browser).
+    def __init__(self, size: int, driver_factory: Callable, fetch_details: Callable,
+                 rate_limiter: RateLimiter, worker_delay: float = 0.0,
+                 cookies: Optional[List[Dict]] = None,
+                 cookie_domain_url: str = "https://www.linkedin.com",
+                 metrics: Optional[MetricsRegistry] = None):
+        self.size = max(1, size)
+        self.driver_factory = driver_factory
+        self.fetch_details = fetch_details
+        self.rate_limiter = rate_limiter
+        self.worker_delay = worker_delay
+        self.cookies = cookies or []
+        self.cookie_domain_url = cookie_domain_url
+        self.metrics = metrics or REGISTRY
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._threads = []
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._started = False
+    
+    def start(self):
+        if self._started:
+            return
+        
+        for i in range(self.size):
+            thread = threading.Thread(target=self._worker, name=f"enrichment-{i+1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        
+        self._started = True
+    
+    def _create_driver(self):
+        driver = self.driver_factory()
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        
+        if self.cookies:
+            # Cookies can only be set for the domain currently loaded
+            driver.get(self.cookie_domain_url)
+            for cookie in self.cookies:
+                cookie = {key: value for key, value in cookie.items() if key != "sameSite"}
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    logger.warning("Could not copy cookie %s: %s", cookie.get('name'), e)
+        
+        return driver
+    
+    def _worker(self):
+        driver = []
+        
+        def driver_provider():
+            if not driver:
+                driver.append(self._create_driver())
+            return driver[0]
+        
+        while True:
+            job = self._tasks.get()
+            if job is _STOP:
+                break
+            
+            try:
+                record_sleep(self.rate_limiter.wait(), "rate_limiter", self.metrics)
+                details = self.fetch_details(job["job_url"], driver_provider=driver_provider)
+                self._results.put((job, details, None))
+            except Exception as e:
+                self._results.put((job, None, e))
+            
+            if self.worker_delay > 0:
+                time.sleep(self.worker_delay)
+                record_sleep(self.worker_delay, "worker_delay", self.metrics)
+    
+    def enrich(self, jobs: List[Dict]) -> Iterator[Tuple[Dict, Optional[Dict], Optional[Exception]]]:
+        # Yields (job, details, error) in completion order
+        self.start()
+        
+        for job in jobs:
+            self._tasks.put(job)
+        
+        for _ in range(len(jobs)):
+            yield self._results.get()
+    
+    def close(self):
+        if self._started:
+            for _ in self._threads:
+                self._tasks.put(_STOP)
+            for thread in self._threads:
+                thread.join(timeout=30)
+        
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        
+        self._threads = []
+        self._started = False
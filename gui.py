@@ -5,6 +5,16 @@ import webbrowser
 from config import Config, SearchFilters, load_config
 from linkedin_automation import LinkedInAutomation
 from database import JobDatabase
+from driver_factory import WarmDriver
+from job_model import JobRowModel
+from log_pipeline import LogQueue, configure_logging
+from metrics import REGISTRY
+
+# Search log batching: drain every LOG_FLUSH_MS, at most LOG_BATCH_SIZE records per tick,
+# and keep no more than LOG_MAX_LINES lines in the log widget
+LOG_FLUSH_MS = 100
+LOG_BATCH_SIZE = 500
+LOG_MAX_LINES = 5000
 
 class JobSearchGUI:
     def __init__(self, root):
@@ -14,10 +24,29 @@ class JobSearchGUI:
         
         self.config = load_config()
         self.db = JobDatabase()
+        self.job_model = JobRowModel(self.db)
         self.automation = None
         
+        # Only one page of the listing is materialised in the Treeview at a time
+        self.listing_page = 0
+        self.listing_page_size = 200
+        self._listing_watermark = None
+        self._listing_loaded_page = None
+        # Keyset of the row each visited page starts after; page 0 starts at the top
+        self._page_cursors = [None]
+        self.search_query = ""
+        
+        self.log_queue = LogQueue()
+        # Automation logs land in the log tab unless LOG_SINK says otherwise
+        configure_logging(self.config, "gui", self.log_queue)
+        self.warm_driver = WarmDriver()
+        if self.config.metrics_port:
+            REGISTRY.serve(self.config.metrics_port)
+        
         self.setup_ui()
         self.load_jobs()
+        self.prewarm_browser()
+        self.root.after(LOG_FLUSH_MS, self._drain_log_queue)
     
     def setup_ui(self):
         self.notebook = ttk.Notebook(self.root)
@@ -91,6 +120,22 @@ class JobSearchGUI:
         ttk.Button(toolbar_frame, text="Open Application", command=self.open_application).pack(side="left", padx=5)
         ttk.Button(toolbar_frame, text="Mark Applied", command=self.mark_applied).pack(side="left", padx=5)
         
+        ttk.Button(toolbar_frame, text="Next ▶", command=self.next_jobs_page).pack(side="right", padx=5)
+        self.page_var = tk.StringVar(value="")
+        ttk.Label(toolbar_frame, textvariable=self.page_var).pack(side="right", padx=5)
+        ttk.Button(toolbar_frame, text="◀ Prev", command=self.previous_jobs_page).pack(side="right", padx=5)
+        
+        search_frame = ttk.Frame(jobs_frame)
+        search_frame.pack(fill="x", padx=10, pady=5)
+        
+        ttk.Label(search_frame, text="Search:").pack(side="left", padx=5)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=50)
+        search_entry.pack(side="left", padx=5)
+        search_entry.bind("<Return>", self.search_listings)
+        ttk.Button(search_frame, text="Search", command=self.search_listings).pack(side="left", padx=5)
+        ttk.Button(search_frame, text="Clear", command=self.clear_search).pack(side="left", padx=5)
+        
         columns = ("ID", "Job Title", "Company", "Location", "Posted Date", "Applied", "Status")
         self.jobs_tree = ttk.Treeview(jobs_frame, columns=columns, show="headings", height=15)
         
@@ -163,11 +208,12 @@ class JobSearchGUI:
             self.config.delay_between_requests = int(self.delay_var.get())
             self.config.max_jobs_per_search = int(self.max_jobs_var.get())
             
-            self.automation = LinkedInAutomation(self.config)
+            driver = self.warm_driver.take(self.config) if self.config.prewarm_browser else None
+            self.automation = LinkedInAutomation(self.config, db=self.db, driver=driver)
             
             self.log("Logging in to LinkedIn...")
             if not self.automation.login():
-                self.log("Login failed!")
+                self.log("Login failed!", "error")
                 return
             
             self.log("Login successful!")
@@ -185,8 +231,9 @@ class JobSearchGUI:
             self.log(f"Search completed! {len(jobs)} jobs processed.")
             
         except Exception as e:
-            self.log(f"Error during search: {str(e)}")
+            self.log(f"Error during search: {str(e)}", "error")
         finally:
+            self.db.release_thread_connection()
             self.search_complete()
     
     def search_complete(self):
@@ -203,6 +250,12 @@ class JobSearchGUI:
             self.automation = None
         
         self.load_jobs()
+        self.prewarm_browser()
+    
+    def prewarm_browser(self):
+        # Start the next search's browser in the background while the user reviews results
+        if self.config.prewarm_browser:
+            self.warm_driver.prewarm(self.config)
     
     def stop_search(self):
         if self.automation:
@@ -210,13 +263,23 @@ class JobSearchGUI:
             self.automation = None
         self.search_complete()
     
-    def log(self, message):
-        self.root.after(0, lambda: self._log_ui(message))
+    def log(self, message, level="info"):
+        # Safe from any thread; the UI picks records up on its next tick
+        self.log_queue.emit(message, level)
     
-    def _log_ui(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+    def _drain_log_queue(self):
+        records = self.log_queue.drain(LOG_BATCH_SIZE)
+        if records:
+            self.log_text.insert(tk.END, "".join(f"{record.format()}\n" for record in records))
+            
+            # Trim the oldest lines so the widget stays small on long crawls
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+            
+            self.log_text.see(tk.END)
+        
+        self.root.after(LOG_FLUSH_MS, self._drain_log_queue)
     
     def refresh_and_clear_duplicates(self):
         # Clear duplicates from database
@@ -231,15 +294,34 @@ class JobSearchGUI:
         # Refresh the job listing
         self.load_jobs()
     
-    def load_jobs(self):
-        jobs = self.db.get_all_jobs()
+    def load_jobs(self, force: bool = False):
+        # Skip the refresh entirely when nothing was added, removed or applied since the last one
+        watermark = self.db.get_change_watermark()
+        loaded_state = (self.listing_page, self.search_query)
+        if not force and watermark == self._listing_watermark and loaded_state == self._listing_loaded_page:
+            return
         
-        for item in self.jobs_tree.get_children():
-            self.jobs_tree.delete(item)
+        # A search box query switches the listing to ranked full-text results
+        total_jobs = self.db.count_search(self.search_query) if self.search_query else watermark[0]
+        page_count = max(1, (total_jobs + self.listing_page_size - 1) // self.listing_page_size)
+        self.listing_page = min(self.listing_page, page_count - 1)
         
+        if self.search_query:
+            offset = self.listing_page * self.listing_page_size
+            jobs = self.db.search(self.search_query, self.listing_page_size, offset)
+        else:
+            # Pages are only reached one step at a time, so the cursor for this page is always known
+            self.listing_page = min(self.listing_page, len(self._page_cursors) - 1)
+            jobs = self.db.get_listing_page(self.listing_page_size, self._page_cursors[self.listing_page])
+            del self._page_cursors[self.listing_page + 1:]
+            if len(jobs) == self.listing_page_size:
+                self._page_cursors.append((jobs[-1]['scraped_date'], jobs[-1]['id']))
+        
+        # Diff the page against the rows already in the tree, keyed by job id
+        wanted = []
         for job in jobs:
             applied_status = "Yes" if job['applied'] else "No"
-            self.jobs_tree.insert("", tk.END, values=(
+            wanted.append((str(job['id']), (
                 job['id'],
                 job['job_title'],
                 job['company_name'],
@@ -247,56 +329,87 @@ class JobSearchGUI:
                 job['posted_date'][:10] if job['posted_date'] else "",
                 applied_status,
                 job['status']
-            ))
+            )))
+        
+        wanted_ids = {iid for iid, _ in wanted}
+        stale = [iid for iid in self.jobs_tree.get_children() if iid not in wanted_ids]
+        if stale:
+            self.jobs_tree.delete(*stale)
+        
+        for index, (iid, values) in enumerate(wanted):
+            if self.jobs_tree.exists(iid):
+                if tuple(str(value) for value in self.jobs_tree.item(iid, 'values')) != tuple(str(value) for value in values):
+                    self.jobs_tree.item(iid, values=values)
+                if self.jobs_tree.index(iid) != index:
+                    self.jobs_tree.move(iid, "", index)
+            else:
+                self.jobs_tree.insert("", index, iid=iid, values=values)
+        
+        label = "matches" if self.search_query else "jobs"
+        self.page_var.set(f"Page {self.listing_page + 1} of {page_count} ({total_jobs} {label})")
+        self._listing_watermark = watermark
+        self._listing_loaded_page = (self.listing_page, self.search_query)
     
-    def on_job_select(self, event):
+    def search_listings(self, event=None):
+        self.search_query = self.search_var.get().strip()
+        self.listing_page = 0
+        self._page_cursors = [None]
+        self.load_jobs()
+    
+    def clear_search(self):
+        self.search_var.set("")
+        self.search_listings()
+    
+    def next_jobs_page(self):
+        self.listing_page += 1
+        self.load_jobs()
+    
+    def previous_jobs_page(self):
+        if self.listing_page > 0:
+            self.listing_page -= 1
+            self.load_jobs()
+    
+    def get_selected_job(self):
         selection = self.jobs_tree.selection()
-        if selection:
-            item = self.jobs_tree.item(selection[0])
-            job_id = item['values'][0]
-            
-            jobs = self.db.get_all_jobs()
-            selected_job = next((job for job in jobs if job['id'] == job_id), None)
+        if not selection:
+            return None
+        
+        item = self.jobs_tree.item(selection[0])
+        return self.job_model.get(int(item['values'][0]))
+    
+    def on_job_select(self, event):
+        selected_job = self.get_selected_job()
+        
+        if selected_job:
+            details = f"Job Title: {selected_job['job_title']}\n"
+            details += f"Company: {selected_job['company_name']}\n"
+            details += f"Location: {selected_job['location']}\n"
+            details += f"Salary: {selected_job['salary_range']}\n"
+            details += f"Experience Level: {selected_job['experience_level']}\n"
+            details += f"Employment Type: {selected_job['employment_type']}\n"
+            details += f"Posted Date: {selected_job['posted_date']}\n"
+            details += f"Application URL: {selected_job['application_url']}\n\n"
+            details += f"Description:\n{selected_job['job_description']}"
             
-            if selected_job:
-                details = f"Job Title: {selected_job['job_title']}\n"
-                details += f"Company: {selected_job['company_name']}\n"
-                details += f"Location: {selected_job['location']}\n"
-                details += f"Salary: {selected_job['salary_range']}\n"
-                details += f"Experience Level: {selected_job['experience_level']}\n"
-                details += f"Employment Type: {selected_job['employment_type']}\n"
-                details += f"Posted Date: {selected_job['posted_date']}\n"
-                details += f"Application URL: {selected_job['application_url']}\n\n"
-                details += f"Description:\n{selected_job['job_description']}"
-                
-                self.details_text.delete(1.0, tk.END)
-                self.details_text.insert(1.0, details)
+            self.details_text.delete(1.0, tk.END)
+            self.details_text.insert(1.0, details)
     
     def open_selected_job(self):
-        selection = self.jobs_tree.selection()
-        if selection:
-            item = self.jobs_tree.item(selection[0])
-            job_id = item['values'][0]
-            
-            jobs = self.db.get_all_jobs()
-            selected_job = next((job for job in jobs if job['id'] == job_id), None)
-            
-            if selected_job and selected_job['job_url']:
-                webbrowser.open(selected_job['job_url'])
+        selected_job = self.get_selected_job()
+        
+        if selected_job and selected_job['job_url']:
+            webbrowser.open(selected_job['job_url'])
     
     def open_application(self):
-        selection = self.jobs_tree.selection()
-        if selection:
-            item = self.jobs_tree.item(selection[0])
-            job_id = item['values'][0]
-            
-            jobs = self.db.get_all_jobs()
-            selected_job = next((job for job in jobs if job['id'] == job_id), None)
-            
-            if selected_job and selected_job['application_url']:
-                webbrowser.open(selected_job['application_url'])
-            else:
-                messagebox.showwarning("Warning", "No application URL found for this job")
+        if not self.jobs_tree.selection():
+            return
+        
+        selected_job = self.get_selected_job()
+        
+        if selected_job and selected_job['application_url']:
+            webbrowser.open(selected_job['application_url'])
+        else:
+            messagebox.showwarning("Warning", "No application URL found for this job")
     
     def mark_applied(self):
         selection = self.jobs_tree.selection()
@@ -324,7 +437,11 @@ class JobSearchGUI:
 def main():
     root = tk.Tk()
     app = JobSearchGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.warm_driver.close()
+        app.db.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
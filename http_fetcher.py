@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from page_parser import parse_job_details
+from rate_limiter import RateLimiter, is_challenge_url
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+)
+
+# Redirect targets meaning the copied session is no longer accepted
+SESSION_LOST_MARKERS = ["/login", "/authwall", "checkpoint", "challenge"]
+
+class HttpDetailFetcher:
+    # Fetches job detail pages over plain HTTP with the cookies of the logged-in
+    # browser. fetch() returns None whenever the page lacks a description so the
+    # caller can fall back to loading it in Chrome.
+    def __init__(self, cookies: Optional[List[Dict]] = None, user_agent: str = DEFAULT_USER_AGENT,
+                 timeout: float = 15.0, pool_size: int = 10, rate_limiter: Optional[RateLimiter] = None):
+        self.timeout = timeout
+        # Pacing happens in the caller; this fetcher only reports what it sees
+        self.rate_limiter = rate_limiter or RateLimiter(0)
+        self.session = requests.Session()
+        
+        # Keep-alive connections are reused from this pool across requests and threads
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self.session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9"
+        })
+        self.set_cookies(cookies or [])
+    
+    @classmethod
+    def from_driver(cls, driver, **kwargs) -> "HttpDetailFetcher":
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception:
+            user_agent = DEFAULT_USER_AGENT
+        return cls(cookies=driver.get_cookies(), user_agent=user_agent or DEFAULT_USER_AGENT, **kwargs)
+    
+    def set_cookies(self, cookies: List[Dict]):
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/")
+            )
+    
+    def fetch(self, job_url: str) -> Optional[Dict]:
+        try:
+            response = self.session.get(job_url, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.warning("HTTP detail fetch failed: %s", e)
+            return None
+        
+        if response.status_code == 429:
+            self.rate_limiter.throttled("http_429")
+        if response.status_code != 200:
+            logger.warning("HTTP detail fetch returned %s for %s", response.status_code, job_url)
+            return None
+        
+        if is_challenge_url(response.url):
+            self.rate_limiter.throttled("challenge")
+        if any(marker in response.url for marker in SESSION_LOST_MARKERS):
+            logger.warning("HTTP detail fetch was redirected to %s", response.url)
+            return None
+        
+        job_details = parse_job_details(response.text, job_url)
+        if not job_details["job_description"]:
+            return None
+        
+        self.rate_limiter.success()
+        return job_details
+    
+    def close(self):
+        self.session.close()
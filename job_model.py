@@ -0,0 +1,31 @@
+from typing import Dict, Optional
+from database import JobDatabase
+
+class JobRowModel:
+    # Caches job rows for the Job Listings tab by id. The cache is dropped
+    # whenever the database reports a write - through this JobDatabase, or
+    # one that moves the change watermark from another process - so lookups
+    # never serve stale rows.
+    def __init__(self, db: JobDatabase):
+        self.db = db
+        self._rows = {}
+        self._version = self._current_version()
+    
+    def _current_version(self) -> tuple:
+        return self.db.write_version, self.db.get_change_watermark()
+    
+    def _check_version(self):
+        version = self._current_version()
+        if self._version != version:
+            self._rows.clear()
+            self._version = version
+    
+    def get(self, job_id: int) -> Optional[Dict]:
+        self._check_version()
+        
+        job = self._rows.get(job_id)
+        if job is None:
+            job = self.db.get_job(job_id)
+            if job is not None:
+                self._rows[job_id] = job
+        return job
@@ -1,78 +1,135 @@
 import time
 import json
-from selenium import webdriver
+import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import re
-from typing import List, Dict, Optional
+from dataclasses import asdict
+from typing import Callable, List, Dict, Optional
 from config import Config, SearchFilters
 from database import JobDatabase
+from dedup import DedupIndex
+from driver_factory import create_chrome_driver
+from enrichment import EnrichmentPool
+from pipeline import EnrichmentConsumer
+from http_fetcher import HttpDetailFetcher
+from rate_limiter import RateLimiter, AdaptiveRateLimiter, is_challenge_url
+from waits import AdaptiveWaiter, CardCountStable
+from session_store import CookieJarStore
+from log_pipeline import get_logger
+from metrics import (MetricsRegistry, REGISTRY, JOBS_TOTAL, SEARCH_PAGES_TOTAL, CARDS_EXTRACTED_TOTAL,
+                     LOGINS_TOTAL, phase_histogram, print_summary, record_sleep)
+from page_parser import (JOB_CARD_SELECTORS, TITLE_SELECTORS, COMPANY_SELECTORS,
+                         LOCATION_SELECTORS, DATE_SELECTORS, classify_card_spans,
+                         clean_title, parse_job_cards, extract_job_id, normalize_search_url)
+
+logger = get_logger(__name__)
 
 class LinkedInAutomation:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, db: Optional[JobDatabase] = None, driver=None,
+                 dedup: Optional[DedupIndex] = None, metrics: Optional[MetricsRegistry] = None,
+                 rate_limiter: Optional[RateLimiter] = None, use_profile: bool = True):
         self.config = config
+        # Chrome locks a profile directory per process, so only one automation may use it
+        self.use_profile = use_profile
         self.driver = None
-        self.db = JobDatabase()
-        self.setup_driver()
+        # A database handed in by the caller (e.g. the GUI) is shared across
+        # threads and stays open after this automation is closed.
+        self._owns_db = db is None
+        self.db = db if db is not None else JobDatabase()
+        # A shared dedup index (see scheduler.SearchScheduler) is loaded once by its owner
+        self.dedup = dedup
+        self._shared_dedup = dedup is not None
+        self.last_search_stats = {}
+        self.enrichment_pool = None
+        self.http_fetcher = None
+        self.waiter = AdaptiveWaiter()
+        self.session_store = CookieJarStore(self.config.session_cookies_file)
+        self.metrics = metrics or REGISTRY
+        self.phases = phase_histogram(self.metrics)
+        # Paces every page load of this automation, its enrichment workers and HTTP fetcher;
+        # the scheduler hands one limiter to all of its workers
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter.from_config(config, self.metrics)
+        self.setup_driver(driver)
+    
+    def setup_driver(self, driver=None):
+        # A pre-started browser (see driver_factory.WarmDriver) skips Chrome's cold start
+        self.driver = driver if driver is not None else self.create_driver(use_profile=self.use_profile)
     
-    def setup_driver(self):
-        chrome_options = Options()
+    def create_driver(self, use_profile: bool = False):
+        with self.phases.time(phase="driver_startup"):
+            return create_chrome_driver(self.config, use_profile)
+    
+    def is_logged_in(self, timeout: float = 10) -> bool:
+        try:
+            self.driver.get(f"{self.config.linkedin_base_url}/feed/")
+        except Exception as e:
+            logger.warning("Session check failed: %s", e)
+            return False
         
-        if self.config.headless_browser:
-            chrome_options.add_argument("--headless")
+        # Expired sessions are redirected to the login/authwall page without the nav bar
+        nav = self.waiter.wait_for(
+            self.driver,
+            EC.presence_of_element_located((By.CLASS_NAME, "global-nav")),
+            "session_check",
+            timeout=timeout
+        )
+        return nav is not None
+    
+    def restore_session(self) -> bool:
+        if self.use_profile and self.config.chrome_profile_dir and self.is_logged_in():
+            logger.info("Reusing logged-in Chrome profile")
+            # Browsers without the profile restore the session from the cookie jar
+            self.save_session()
+            return True
         
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        cookies = self.session_store.load()
+        if not cookies:
+            return False
         
         try:
-            # Custom ChromeDriver setup to fix webdriver-manager bug
-            import os
-            import stat
-            import glob
-            
-            # Get base driver path from webdriver-manager
-            base_path = ChromeDriverManager().install()
-            base_dir = os.path.dirname(base_path)
-            
-            # Find the actual chromedriver executable
-            chromedriver_files = glob.glob(os.path.join(base_dir, "**/chromedriver"), recursive=True)
-            
-            if chromedriver_files:
-                driver_path = chromedriver_files[0]
-                print(f"Found chromedriver at: {driver_path}")
-                
-                # Make sure the driver is executable
-                os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
-                
-                service = Service(driver_path)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            else:
-                raise Exception("Could not find chromedriver executable")
-                
+            # Cookies can only be added for the domain currently loaded
+            self.driver.get(self.config.linkedin_base_url)
+            for cookie in cookies:
+                cookie = {key: value for key, value in cookie.items() if key != "sameSite"}
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
         except Exception as e:
-            print(f"Error setting up ChromeDriver: {e}")
-            try:
-                # Fallback: try system Chrome installation
-                print("Trying system Chrome installation...")
-                self.driver = webdriver.Chrome(options=chrome_options)
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            except Exception as e2:
-                print(f"System Chrome also failed: {e2}")
-                raise Exception("Could not initialize ChromeDriver")
+            logger.warning("Could not restore saved session: %s", e)
+            return False
+        
+        if self.is_logged_in():
+            logger.info("Restored saved LinkedIn session")
+            return True
+        
+        logger.warning("Saved session has expired, logging in again")
+        self.session_store.clear()
+        return False
+    
+    def save_session(self):
+        try:
+            self.session_store.save(self.driver.get_cookies())
+        except Exception as e:
+            logger.warning("Could not save session cookies: %s", e)
     
     def login(self) -> bool:
+        start = time.perf_counter()
+        logged_in = self._login()
+        self.phases.observe(time.perf_counter() - start, phase="login")
+        self.metrics.counter(LOGINS_TOTAL, "Login attempts by result").inc(result="success" if logged_in else "failure")
+        return logged_in
+    
+    def _login(self) -> bool:
+        if self.config.reuse_session and self.restore_session():
+            return True
+        
         try:
-            self.driver.get("https://www.linkedin.com/login")
+            self.driver.get(f"{self.config.linkedin_base_url}/login")
             
             # Wait for login form to load
             email_field = WebDriverWait(self.driver, 15).until(
@@ -86,137 +143,235 @@ class LinkedInAutomation:
             login_button = self.driver.find_element(By.XPATH, '//button[@type="submit"]')
             login_button.click()
             
-            print("Login submitted, waiting for verification or redirect...")
+            logger.info("Login submitted, waiting for verification or redirect...")
             
             # Wait longer for potential verification steps
             max_wait_time = 120  # 2 minutes for user verification
             wait_interval = 5
+            login_start = time.monotonic()
             elapsed_time = 0
+            challenge_reported = False
+            
+            # Returns as soon as the nav bar or a login error shows up
+            def login_settled(driver):
+                return (driver.find_elements(By.CLASS_NAME, "global-nav")
+                        or driver.find_elements(By.CLASS_NAME, "form__label--error"))
             
             while elapsed_time < max_wait_time:
                 try:
                     # Check if we're on the main LinkedIn page (successful login)
                     if self.driver.find_elements(By.CLASS_NAME, "global-nav"):
-                        print("Successfully logged in to LinkedIn")
+                        logger.info("Successfully logged in to LinkedIn")
+                        self.waiter.record("login", time.monotonic() - login_start)
+                        self.save_session()
                         return True
                     
                     # Check for challenge/verification page
-                    if "challenge" in self.driver.current_url or "checkpoint" in self.driver.current_url:
-                        print(f"Verification required. Please complete verification in browser. Waiting... ({elapsed_time}s/{max_wait_time}s)")
+                    if is_challenge_url(self.driver.current_url):
+                        if not challenge_reported:
+                            # Slow the crawl that follows once the user gets through
+                            self.rate_limiter.throttled("challenge")
+                            challenge_reported = True
+                        logger.warning("Verification required. Please complete verification in browser. Waiting... (%ss/%ss)", elapsed_time, max_wait_time)
                     
                     # Check for login error messages
                     error_elements = self.driver.find_elements(By.CLASS_NAME, "form__label--error")
                     if error_elements:
-                        print(f"Login error: {error_elements[0].text}")
+                        logger.error("Login error: %s", error_elements[0].text)
                         return False
                     
-                    time.sleep(wait_interval)
-                    elapsed_time += wait_interval
+                    self.waiter.wait_for(self.driver, login_settled, "login_poll", timeout=wait_interval)
                     
                 except Exception as e:
-                    print(f"Waiting for login completion... ({elapsed_time}s/{max_wait_time}s)")
-                    time.sleep(wait_interval)
-                    elapsed_time += wait_interval
+                    logger.info("Waiting for login completion... (%ss/%ss)", elapsed_time, max_wait_time)
+                    time.sleep(1)
+                
+                elapsed_time = int(time.monotonic() - login_start)
             
             # Final check after timeout
             if self.driver.find_elements(By.CLASS_NAME, "global-nav"):
-                print("Login completed successfully after verification")
+                logger.info("Login completed successfully after verification")
+                self.save_session()
                 return True
             else:
-                print("Login failed - timeout waiting for verification completion")
+                logger.error("Login failed - timeout waiting for verification completion")
                 return False
             
         except TimeoutException:
-            print("Login failed - initial page load timeout")
+            logger.error("Login failed - initial page load timeout")
             return False
         except Exception as e:
-            print(f"Login failed: {str(e)}")
+            logger.error("Login failed: %s", e)
             return False
     
-    def search_jobs(self, filters: SearchFilters) -> List[Dict]:
+    def load_dedup_index(self) -> DedupIndex:
+        self.dedup = DedupIndex(self.db, max_exact_keys=self.config.dedup_max_exact_keys).load()
+        mode = "bloom filter" if self.dedup.probabilistic else "exact"
+        logger.info("Loaded dedup index (%s)", mode)
+        return self.dedup
+    
+    def search_jobs(self, filters: SearchFilters, resume: bool = False) -> List[Dict]:
+        self.last_search_stats = {"pages_processed": 0, "jobs_processed": 0, "jobs_saved": 0}
+        consumer = None
         try:
-            search_url = self._build_search_url(filters)
-            print(f"Searching with URL: {search_url}")
-            self.driver.get(search_url)
+            # Preload every known job key once so pages can be filtered without DB round trips
+            if not self._shared_dedup:
+                self.load_dedup_index()
             
-            # Wait for page to load
-            time.sleep(5)
+            search_url = self._build_search_url(filters)
+            logger.info("Searching with URL: %s", search_url)
+            
+            # High-water mark left by the previous run of this query, if any
+            query_key = normalize_search_url(search_url)
+            search_mark = self.db.get_search_mark(query_key) if self.config.incremental_crawl else None
+            known_job_ids = set(search_mark["seen_job_ids"]) if search_mark else set()
+            seen_job_ids = []
+            newest_posted_date = search_mark["newest_posted_date"] if search_mark else None
+            
+            # Pick up where an interrupted run of this query stopped
+            checkpoint = self.db.get_crawl_checkpoint(query_key) if resume else None
+            if checkpoint and checkpoint["status"] == "done":
+                checkpoint = None
+            start_page = checkpoint["next_page"] if checkpoint else 1
+            resumed_saved = checkpoint["jobs_saved"] if checkpoint else 0
+            total_saved = resumed_saved
+            if self.config.pipeline_enrichment:
+                # Cards are enriched on the consumer's own browsers while this one keeps paging
+                consumer = EnrichmentConsumer(self, max_pending=self.config.pipeline_queue_size).start()
+            if checkpoint:
+                logger.info("Resuming from page %s with %s jobs already saved", start_page, total_saved)
+                if consumer:
+                    consumer.put(self.pending_retries(query_key))
+                else:
+                    total_saved += self.retry_pending_jobs(query_key)
+            self.db.save_crawl_checkpoint(query_key, search_url, asdict(filters), start_page, total_saved)
+            # Saved jobs from earlier runs plus new cards handed to the consumer in this one
+            pipeline_base = total_saved
+            
+            self.pace()
+            with self.phases.time(phase="search_page_load"):
+                self.driver.get(self._page_url(search_url, start_page))
+                
+                # Wait until the result list has rendered instead of a fixed sleep
+                self.waiter.wait_for(self.driver, CardCountStable(JOB_CARD_SELECTORS), "search_page_load")
             
-            # Debug: check current URL and page title
-            print(f"Current URL: {self.driver.current_url}")
-            print(f"Page title: {self.driver.title}")
+            # Debug: check current URL and page title (each is a WebDriver round trip)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Current URL: %s", self.driver.current_url)
+                logger.debug("Page title: %s", self.driver.title)
             
             jobs = []
-            page_num = 1
-            total_saved = 0
+            page_num = start_page
             
             # Try multiple selectors for job cards
-            job_selectors = [
-                ".job-search-card",
-                ".jobs-search-results__list-item",
-                ".job-result-card",
-                "[data-job-id]",
-                ".jobs-search-results-list .jobs-search-results__list-item"
-            ]
+            job_selectors = JOB_CARD_SELECTORS
             
             job_cards = []
             for selector in job_selectors:
                 job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                print(f"Found {len(job_cards)} job cards with selector: {selector}")
+                logger.debug("Found %s job cards with selector: %s", len(job_cards), selector)
                 if job_cards:
                     break
             
             if not job_cards:
                 # Debug: save page source to see what we're getting
-                print("No job cards found. Checking page content...")
+                logger.info("No job cards found. Checking page content...")
                 page_source = self.driver.page_source
-                if "sign-in" in page_source.lower() or "login" in page_source.lower():
-                    print("Warning: Might be redirected to login page")
+                if is_challenge_url(self.driver.current_url):
+                    self.rate_limiter.throttled("challenge")
+                elif "sign-in" in page_source.lower() or "login" in page_source.lower():
+                    logger.warning("Warning: Might be redirected to login page")
                 elif "no jobs found" in page_source.lower():
-                    print("LinkedIn reports no jobs found for this search")
+                    logger.info("LinkedIn reports no jobs found for this search")
                 else:
-                    print("Page loaded but job cards not found with current selectors")
+                    logger.warning("Page loaded but job cards not found with current selectors")
+                    self.rate_limiter.throttled("empty_page")
+                if consumer:
+                    consumer.finish()
+                # Nothing to continue from, so --resume must not pick this search up again
+                self.db.save_crawl_checkpoint(query_key, search_url, asdict(filters), start_page,
+                                              total_saved, status="done")
                 return []
+            self.rate_limiter.success()
             
             pages_processed = 0
             max_pages = 25  # Limit to prevent infinite loops
+            caught_up = False
             
             while total_saved < self.config.max_jobs_per_search and pages_processed < max_pages:
                 pages_processed += 1
-                print(f"\n--- Processing page {page_num} (attempt {pages_processed}) ---")
+                logger.info("--- Processing page %s (attempt %s) ---", page_num, pages_processed)
                 
                 # Process current page jobs
-                page_jobs = []
-                print(f"Attempting to extract from {len(job_cards)} job cards...")
+                logger.debug("Attempting to extract from %s job cards...", len(job_cards))
+                with self.phases.time(phase="card_extraction"):
+                    page_jobs = self._extract_page_jobs(job_cards)
+                self.metrics.counter(SEARCH_PAGES_TOTAL, "Search result pages processed").inc()
+                self.metrics.counter(CARDS_EXTRACTED_TOTAL, "Job cards extracted from search pages").inc(len(page_jobs))
                 
-                for i, card in enumerate(job_cards):
-                    job_data = self._extract_job_card_data(card)
-                    if job_data:
-                        page_jobs.append(job_data)
-                        print(f"✓ Extracted job {i+1}: {job_data['job_title']} at {job_data['company_name']}")
-                    else:
-                        print(f"❌ Failed to extract job {i+1}")
+                logger.info("Successfully extracted %s out of %s job cards", len(page_jobs), len(job_cards))
+                
+                # Results are sorted newest first, so a page made only of jobs seen before
+                # means everything after it was crawled on a previous run
+                page_known = bool(search_mark) and bool(page_jobs) and all(
+                    self._is_known_job(job, known_job_ids) for job in page_jobs
+                )
+                for job in page_jobs:
+                    seen_job_ids.append(extract_job_id(job["job_url"]))
+                    if job.get("posted_date") and (not newest_posted_date or job["posted_date"] > newest_posted_date):
+                        newest_posted_date = job["posted_date"]
+                
+                if page_known:
+                    logger.info("✓ Page %s only has jobs from previous runs, stopping early", page_num)
+                    jobs.extend(page_jobs)
+                    caught_up = True
+                    break
                 
-                print(f"Successfully extracted {len(page_jobs)} out of {len(job_cards)} job cards")
+                # Queue the page's cards before enriching them; a crash from here on
+                # resumes at the next page and retries whatever is still queued
+                self.db.save_crawl_checkpoint(query_key, search_url, asdict(filters), page_num + 1,
+                                              (resumed_saved + consumer.saved()) if consumer else total_saved,
+                                              pending_jobs=page_jobs)
                 
                 # Save current page jobs to database incrementally
-                if page_jobs:
-                    print(f"Processing {len(page_jobs)} jobs from page {page_num}...")
+                if page_jobs and consumer:
+                    # Counted towards the target when handed over, so paging stops in time
+                    pipeline_base += sum(1 for job in page_jobs if self.dedup.check(job) is None)
+                    consumer.put(page_jobs)
+                    total_saved = pipeline_base
+                    jobs.extend(page_jobs)
+                    
+                    logger.info("Progress: %s/%s new jobs queued, %s saved", total_saved,
+                                self.config.max_jobs_per_search, consumer.saved())
+                elif page_jobs:
+                    logger.info("Processing %s jobs from page %s...", len(page_jobs), page_num)
+                    results_url = self.driver.current_url
                     saved_count = self.save_jobs_to_database(page_jobs)
                     total_saved += saved_count
                     jobs.extend(page_jobs)
                     
-                    print(f"Progress: {total_saved}/{self.config.max_jobs_per_search} new jobs saved")
+                    if self.driver.current_url != results_url:
+                        # Details were loaded in this browser, so it has left the results
+                        # and the next button with them; reopen this page by its offset
+                        self.pace()
+                        self.driver.get(self._page_url(search_url, page_num))
+                        self.waiter.wait_for(self.driver, CardCountStable(job_selectors), "search_page_load")
+                        for selector in job_selectors:
+                            job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                            if job_cards:
+                                break
+                    
+                    logger.info("Progress: %s/%s new jobs saved", total_saved, self.config.max_jobs_per_search)
                 else:
-                    print("❌ No jobs extracted from current page - this is a problem!")
+                    logger.warning("❌ No jobs extracted from current page - this is a problem!")
                 
                 # Check if we need more jobs
-                print(f"Current status: {total_saved}/{self.config.max_jobs_per_search} new jobs saved")
+                logger.debug("Current status: %s/%s new jobs saved", total_saved, self.config.max_jobs_per_search)
                 if total_saved >= self.config.max_jobs_per_search:
-                    print(f"✓ Reached target of {self.config.max_jobs_per_search} new jobs saved")
+                    logger.info("✓ Reached target of %s new jobs saved", self.config.max_jobs_per_search)
                     break
                 else:
-                    print(f"Need {self.config.max_jobs_per_search - total_saved} more jobs, continuing to next page...")
+                    logger.debug("Need %s more jobs, continuing to next page...", self.config.max_jobs_per_search - total_saved)
                 
                 # Try to navigate to next page
                 try:
@@ -231,94 +386,165 @@ class LinkedInAutomation:
                     next_button = None
                     for selector in next_selectors:
                         buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        print(f"Found {len(buttons)} buttons with selector: {selector}")
+                        logger.debug("Found %s buttons with selector: %s", len(buttons), selector)
                         if buttons:
                             for button in buttons:
                                 if button.is_enabled() and button.is_displayed():
                                     next_button = button
-                                    print(f"Found working next button: {selector}")
+                                    logger.debug("Found working next button: %s", selector)
                                     break
                         if next_button:
                             break
                     
                     if next_button:
-                        print(f"Clicking next button to go to page {page_num + 1}")
+                        logger.info("Clicking next button to go to page %s", page_num + 1)
+                        previous_url = self.driver.current_url
+                        previous_card = job_cards[0] if job_cards else None
+                        self.pace()
+                        load_start = time.perf_counter()
                         next_button.click()
-                        time.sleep(self.config.delay_between_requests)
                         page_num += 1
-                        print(f"Now on page {page_num}")
+                        logger.debug("Now on page %s", page_num)
                         
-                        # Wait for new page to load
-                        time.sleep(3)
+                        # Wait for the old results to go away, then for the new list to settle
+                        page_changed = [EC.url_changes(previous_url)]
+                        if previous_card is not None:
+                            page_changed.append(EC.staleness_of(previous_card))
+                        self.waiter.wait_for(self.driver, EC.any_of(*page_changed), "page_change")
+                        self.waiter.wait_for(self.driver, CardCountStable(job_selectors), "search_page_load")
+                        self.phases.observe(time.perf_counter() - load_start, phase="search_page_load")
                         
                         # Get fresh job cards for next page (avoid stale references)
                         job_cards = []
                         for selector in job_selectors:
                             job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
                             if job_cards:
-                                print(f"Found {len(job_cards)} job cards on page {page_num}")
+                                logger.debug("Found %s job cards on page %s", len(job_cards), page_num)
                                 break
-                                
+                        
+                        if job_cards:
+                            self.rate_limiter.success()
+                        else:
+                            # A next page that renders without results is how throttling usually shows
+                            self.rate_limiter.throttled(
+                                "challenge" if is_challenge_url(self.driver.current_url) else "empty_page"
+                            )
+                        
                         if not job_cards:
-                            print("No more job cards found on next page")
+                            logger.warning("No more job cards found on next page")
                             # Try to continue for a few more attempts
                             if page_num < 10:  # Don't give up too easily
-                                print("Trying to continue anyway...")
+                                logger.info("Trying to continue anyway...")
                                 # Wait a bit more and try again
-                                time.sleep(2)
+                                self.waiter.wait_for(self.driver, CardCountStable(job_selectors), "card_retry", timeout=5)
                                 for selector in job_selectors:
                                     job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
                                     if job_cards:
-                                        print(f"Found {len(job_cards)} job cards after retry")
+                                        logger.info("Found %s job cards after retry", len(job_cards))
                                         break
                                 if not job_cards:
-                                    print("Still no job cards after retry, continuing to next page")
+                                    logger.warning("Still no job cards after retry, continuing to next page")
                                     continue
                             else:
                                 break
                     else:
-                        print("No next button found or all buttons disabled")
+                        logger.info("No next button found or all buttons disabled")
                         # Check if we're actually at the end or if there's another way to continue
                         page_source = self.driver.page_source
                         if "no more results" in page_source.lower() or "end of results" in page_source.lower():
-                            print("Reached end of results")
+                            logger.info("Reached end of results")
                             break
                         else:
-                            print("No pagination found, but may not be at end")
+                            logger.info("No pagination found, but may not be at end")
                             break
                         
                 except Exception as e:
-                    print(f"Error navigating to next page: {str(e)}")
+                    logger.warning("Error navigating to next page: %s", e)
                     # Don't break immediately, try to continue
-                    print("Attempting to continue despite navigation error...")
+                    logger.info("Attempting to continue despite navigation error...")
                     # Wait and try to find jobs on current page again
-                    time.sleep(3)
+                    self.waiter.wait_for(self.driver, CardCountStable(job_selectors), "card_retry", timeout=5)
                     for selector in job_selectors:
                         job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
                         if job_cards:
-                            print(f"Found {len(job_cards)} job cards after error recovery")
+                            logger.info("Found %s job cards after error recovery", len(job_cards))
                             break
                     if not job_cards:
-                        print("No job cards found after error recovery, stopping")
+                        logger.warning("No job cards found after error recovery, stopping")
                         break
             
-            print(f"\n=== SEARCH COMPLETED ===")
-            print(f"Pages processed: {pages_processed}")
-            print(f"Total jobs processed: {len(jobs)}")
-            print(f"Total jobs saved: {total_saved}")
-            print(f"Target was: {self.config.max_jobs_per_search}")
+            if consumer:
+                logger.info("Paging finished, waiting for enrichment of the queued jobs...")
+                total_saved = resumed_saved + consumer.finish()
+            
+            if self.config.incremental_crawl:
+                self._save_search_mark(query_key, newest_posted_date, seen_job_ids, search_mark)
+            # An exception above leaves the checkpoint running, so --resume picks it up
+            self.db.save_crawl_checkpoint(query_key, search_url, asdict(filters), page_num + 1,
+                                          total_saved, status="done")
             
-            if total_saved < self.config.max_jobs_per_search:
-                print(f"⚠️  WARNING: Only saved {total_saved} jobs, target was {self.config.max_jobs_per_search}")
+            self.last_search_stats = {
+                "pages_processed": pages_processed,
+                "jobs_processed": len(jobs),
+                "jobs_saved": total_saved
+            }
+            
+            logger.info("=== SEARCH COMPLETED ===")
+            logger.info("Pages processed: %s", pages_processed)
+            logger.info("Total jobs processed: %s", len(jobs))
+            logger.info("Total jobs saved: %s", total_saved)
+            logger.info("Target was: %s", self.config.max_jobs_per_search)
+            
+            self.waiter.print_report()
+            print_summary(self.metrics)
+            self.export_metrics()
+            
+            if caught_up:
+                # Not a shortfall: there were no more new jobs than these since the last run
+                logger.info("Saved %s new jobs (target %s); the rest of the results were crawled on a previous run",
+                            total_saved, self.config.max_jobs_per_search)
+            elif total_saved < self.config.max_jobs_per_search:
+                logger.warning("⚠️  WARNING: Only saved %s jobs, target was %s", total_saved, self.config.max_jobs_per_search)
             
             return jobs
             
         except Exception as e:
-            print(f"Job search failed: {str(e)}")
+            logger.error("Job search failed: %s", e)
+            # Callers such as the scheduler tell a crashed search from one without results by this
+            self.last_search_stats["error"] = str(e) or type(e).__name__
+            if consumer:
+                consumer.abort()
             return []
     
+    def pace(self):
+        # Blocks until the shared rate limiter allows the next page load
+        record_sleep(self.rate_limiter.wait(), "rate_limiter", self.metrics)
+    
+    def _is_known_job(self, job: Dict, known_job_ids: set) -> bool:
+        if extract_job_id(job["job_url"]) in known_job_ids:
+            return True
+        return self.dedup.check(job) is not None
+    
+    def _save_search_mark(self, query_key: str, newest_posted_date: Optional[str],
+                          seen_job_ids: List[str], search_mark: Optional[Dict]):
+        # Newest ids first; ids from earlier runs fill the rest up to the cap
+        job_ids = list(dict.fromkeys(seen_job_ids))
+        if search_mark:
+            current = set(job_ids)
+            job_ids.extend(job_id for job_id in search_mark["seen_job_ids"] if job_id not in current)
+        
+        try:
+            self.db.save_search_mark(query_key, newest_posted_date, job_ids[:self.config.search_mark_max_ids])
+        except Exception as e:
+            logger.warning("Could not save search high-water mark: %s", e)
+    
+    def _page_url(self, search_url: str, page_num: int) -> str:
+        if page_num <= 1:
+            return search_url
+        return f"{search_url}&start={(page_num - 1) * self.config.search_page_size}"
+    
     def _build_search_url(self, filters: SearchFilters) -> str:
-        base_url = "https://www.linkedin.com/jobs/search/?"
+        base_url = f"{self.config.linkedin_base_url}/jobs/search/?"
         params = []
         
         if filters.job_title:
@@ -348,24 +574,41 @@ class LinkedInAutomation:
             if filters.time_posted.lower() in time_map:
                 params.append(f"f_TPR={time_map[filters.time_posted.lower()]}")
         
+        if self.config.sort_by_recency:
+            # Newest first, so incremental crawls can stop at the first fully known page
+            params.append("sortBy=DD")
+        
         return base_url + "&".join(params)
     
+    def _extract_page_jobs(self, job_cards) -> List[Dict]:
+        page_jobs = []
+        
+        if self.config.card_extraction_mode == "html":
+            # Parse the whole page from a single page_source read
+            page_jobs, card_count = parse_job_cards(self.driver.page_source, self.driver.current_url)
+            if page_jobs:
+                for i, job_data in enumerate(page_jobs):
+                    logger.debug("✓ Extracted job %s: %s at %s", i+1, job_data['job_title'], job_data['company_name'])
+                return page_jobs
+            logger.info("HTML extraction found no jobs in %s cards, falling back to WebDriver", card_count)
+        
+        for i, card in enumerate(job_cards):
+            job_data = self._extract_job_card_data(card)
+            if job_data:
+                page_jobs.append(job_data)
+                logger.debug("✓ Extracted job %s: %s at %s", i+1, job_data['job_title'], job_data['company_name'])
+            else:
+                logger.debug("❌ Failed to extract job %s", i+1)
+        
+        return page_jobs
+    
     def _extract_job_card_data(self, card) -> Optional[Dict]:
         try:
             # Try multiple selectors for job title and link (updated for current LinkedIn structure)
             job_title = ""
             job_url = ""
             
-            title_selectors = [
-                ".job-card-container__link",
-                "a[aria-label]",
-                ".job-card-list__title a",
-                ".job-search-card__title a",
-                ".job-result-card__title a",
-                "h3 a[data-control-name*='job']"
-            ]
-            
-            for selector in title_selectors:
+            for selector in TITLE_SELECTORS:
                 try:
                     title_element = card.find_element(By.CSS_SELECTOR, selector)
                     job_title = title_element.text.strip()
@@ -383,7 +626,7 @@ class LinkedInAutomation:
                     continue
             
             if not job_title:
-                print("Could not find job title in card")
+                logger.debug("Could not find job title in card")
                 return None
             
             # Extract company name and location from span elements
@@ -395,77 +638,24 @@ class LinkedInAutomation:
                 spans = card.find_elements(By.TAG_NAME, "span")
                 span_texts = [span.text.strip() for span in spans if span.text.strip()]
                 
-                print(f"   Debug - All span texts: {span_texts}")
-                
-                # Clean job title for comparison (remove extra text)
-                clean_job_title = job_title.split("\n")[0].strip()
-                if " with verification" in clean_job_title:
-                    clean_job_title = clean_job_title.replace(" with verification", "")
-                
-                # Based on debug output, company is typically around index 2-3, location around index 3-4
-                skip_texts = [job_title, clean_job_title, "Promoted", "Easy Apply", "Actively hiring"]
-                # Also skip variations of the job title
-                if " with verification" in job_title:
-                    skip_texts.append(job_title.replace(" with verification", ""))
-                
-                # Add the individual components that might appear in spans
-                job_title_parts = job_title.split()
-                job_title_first_part = job_title_parts[0] if job_title_parts else ""
-                if job_title_first_part:
-                    # Find the base job title (first occurrence before repetition)
-                    job_title_base = job_title.split(" " + job_title_first_part)[0].strip()
-                    if job_title_base:
-                        skip_texts.append(job_title_base)
-                        skip_texts.append(job_title_base + " with verification")
-                
-                for i, text in enumerate(span_texts):
-                    print(f"   Debug - Checking span {i}: '{text}'")
-                    # Skip job titles, "Promoted", "Easy Apply", etc.
-                    if text and text not in skip_texts and len(text) > 2:
-                        # Check if this looks like a location
-                        location_indicators = ["CA", "NY", "TX", "FL", "IL", "Remote", "Hybrid", "On-site", "Metropolitan Area", "United States", "(", ")"]
-                        is_location = any(indicator in text for indicator in location_indicators)
-                        
-                        if is_location:
-                            # This looks like a location
-                            if not location:
-                                location = text
-                                print(f"   Debug - Found location: {location}")
-                        else:
-                            # This looks like a company name
-                            if not company_name:
-                                company_name = text
-                                print(f"   Debug - Found company: {company_name}")
-                            elif not location:
-                                # If we already have a company, this might be location
-                                location = text
-                                print(f"   Debug - Found location (fallback): {location}")
+                company_name, location = classify_card_spans(job_title, span_texts)
+                clean_job_title = clean_title(job_title)
                 
                 # If we still don't have a company name, try alternative extraction
                 if not company_name:
                     # Try finding company name in specific elements
-                    company_selectors = [
-                        ".artdeco-entity-lockup__subtitle",
-                        ".job-card-container__company-name",
-                        ".job-card-list__company-name",
-                        "h4 a"
-                    ]
-                    for selector in company_selectors:
+                    for selector in COMPANY_SELECTORS:
                         try:
                             element = card.find_element(By.CSS_SELECTOR, selector)
                             company_name = element.text.strip()
                             if company_name and company_name != clean_job_title:
-                                print(f"   Debug - Found company via selector {selector}: {company_name}")
+                                logger.debug("Found company via selector %s: %s", selector, company_name)
                                 break
                         except:
                             continue
                 
                 if not location:
-                    location_selectors = [
-                        ".job-card-container__metadata-item",
-                        ".job-card-list__location"
-                    ]
-                    for selector in location_selectors:
+                    for selector in LOCATION_SELECTORS:
                         try:
                             location = card.find_element(By.CSS_SELECTOR, selector).text.strip()
                             break
@@ -473,18 +663,12 @@ class LinkedInAutomation:
                             continue
                             
             except Exception as e:
-                print(f"Error extracting company/location: {e}")
+                logger.warning("Error extracting company/location: %s", e)
                 pass
             
             # Try to get posted date
             posted_date = ""
-            date_selectors = [
-                ".job-search-card__listitem--footerItem time",
-                ".job-result-card__listitem--footerItem time",
-                "time[datetime]"
-            ]
-            
-            for selector in date_selectors:
+            for selector in DATE_SELECTORS:
                 try:
                     posted_date = card.find_element(By.CSS_SELECTOR, selector).get_attribute("datetime")
                     break
@@ -505,34 +689,46 @@ class LinkedInAutomation:
             }
             
         except Exception as e:
-            print(f"Error extracting job card data: {str(e)}")
+            logger.warning("Error extracting job card data: %s", e)
             return None
     
-    def get_job_details(self, job_url: str) -> Dict:
+    def get_job_details(self, job_url: str, driver=None) -> Dict:
+        with self.phases.time(phase="job_details"):
+            return self._get_job_details(job_url, driver)
+    
+    def _get_job_details(self, job_url: str, driver=None) -> Dict:
+        driver = driver or self.driver
         try:
-            self.driver.get(job_url)
-            time.sleep(2)
+            driver.get(job_url)
+            self.waiter.wait_for(
+                driver,
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".job-details__description-text")),
+                "detail_page_load"
+            )
             
             job_details = {}
             
             try:
-                description_element = self.driver.find_element(By.CSS_SELECTOR, ".job-details__description-text")
+                description_element = driver.find_element(By.CSS_SELECTOR, ".job-details__description-text")
                 job_details["job_description"] = description_element.text.strip()
+                self.rate_limiter.success()
             except:
                 job_details["job_description"] = ""
+                if is_challenge_url(driver.current_url):
+                    self.rate_limiter.throttled("challenge")
             
             try:
-                apply_button = self.driver.find_element(By.CSS_SELECTOR, 'a[data-control-name="jobdetails_topcard_inapply"]')
+                apply_button = driver.find_element(By.CSS_SELECTOR, 'a[data-control-name="jobdetails_topcard_inapply"]')
                 job_details["application_url"] = apply_button.get_attribute("href")
             except:
                 try:
-                    apply_button = self.driver.find_element(By.CSS_SELECTOR, '.jobs-apply-button')
+                    apply_button = driver.find_element(By.CSS_SELECTOR, '.jobs-apply-button')
                     job_details["application_url"] = job_url
                 except:
                     job_details["application_url"] = ""
             
             try:
-                salary_element = self.driver.find_element(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-insight span")
+                salary_element = driver.find_element(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-insight span")
                 job_details["salary_range"] = salary_element.text.strip()
             except:
                 job_details["salary_range"] = ""
@@ -540,61 +736,173 @@ class LinkedInAutomation:
             return job_details
             
         except Exception as e:
-            print(f"Error getting job details: {str(e)}")
+            logger.error("Error getting job details: %s", e)
             return {}
     
-    def save_jobs_to_database(self, jobs: List[Dict]):
+    def get_http_fetcher(self) -> HttpDetailFetcher:
+        if self.http_fetcher is None:
+            self.http_fetcher = HttpDetailFetcher.from_driver(
+                self.driver, pool_size=max(self.config.enrichment_workers, 1), rate_limiter=self.rate_limiter
+            )
+        return self.http_fetcher
+    
+    def fetch_job_details(self, job_url: str, driver=None, driver_provider: Optional[Callable] = None) -> Dict:
+        # driver_provider starts a browser on demand, so HTTP mode only pays for one on fallback
+        if self.config.detail_fetch_mode == "http":
+            with self.phases.time(phase="job_details_http"):
+                job_details = self.get_http_fetcher().fetch(job_url)
+            if job_details:
+                return job_details
+            logger.info("HTTP page missing job details, loading it in the browser")
+        
+        if driver is None and driver_provider is not None:
+            driver = driver_provider()
+        return self.get_job_details(job_url, driver)
+    
+    def save_jobs_to_database(self, jobs: List[Dict], use_pool: bool = False):
         saved_count = 0
         duplicate_count = 0
         error_count = 0
+        # Outcomes for the pending_jobs queue: finished URLs leave it, failures count an attempt
+        done_urls = []
+        failures = []
         
-        print(f"Attempting to save {len(jobs)} jobs...")
+        logger.info("Attempting to save %s jobs...", len(jobs))
         
-        for i, job in enumerate(jobs):
-            print(f"\n--- Processing job {i+1}/{len(jobs)} ---")
-            print(f"Title: {job['job_title']}")
-            print(f"Company: {job['company_name']}")
-            print(f"Location: {job['location']}")
-            print(f"URL: {job['job_url']}")
-            
-            # Check if job already exists in database (by URL or by details)
-            url_exists = self.db.job_exists(job["job_url"])
-            details_exist = self.db.job_exists_by_details(
-                job["job_title"], job["company_name"], job["location"]
-            )
-            
-            if url_exists or details_exist:
-                duplicate_count += 1
-                duplicate_reason = "URL" if url_exists else "details"
-                print(f"❌ DUPLICATE ({duplicate_reason}): {job['job_title']} at {job['company_name']}")
-                continue
-            
-            print(f"✓ New job, getting details...")
-            try:
-                job_details = self.get_job_details(job["job_url"])
-                job.update(job_details)
+        if self.dedup is None:
+            self.load_dedup_index()
+        
+        # Filter the whole page in memory before any detail page is loaded
+        new_jobs, duplicates = self.dedup.filter_new(jobs)
+        for job, duplicate_reason in duplicates:
+            duplicate_count += 1
+            done_urls.append(job["job_url"])
+            logger.debug("❌ DUPLICATE (%s): %s at %s", duplicate_reason, job['job_title'], job['company_name'])
+        
+        # use_pool keeps the main browser free, e.g. while it pages through results
+        if new_jobs and (use_pool or (self.config.enrichment_workers > 1 and len(new_jobs) > 1)):
+            # Details are fetched concurrently; this thread remains the only DB writer
+            logger.info("Enriching %s jobs with %s browser workers...", len(new_jobs), self.config.enrichment_workers)
+            pool = self.get_enrichment_pool()
+            for job, job_details, error in pool.enrich(new_jobs):
+                if error is not None:
+                    error_count += 1
+                    failures.append((job["job_url"], error))
+                    self.dedup.release(job)
+                    logger.error("❌ ERROR getting job details for %s: %s", job['job_title'], error)
+                    continue
                 
-                if self.db.add_job(job):
+                job.update(job_details)
+                if self._store_job(job, saved_count + 1):
                     saved_count += 1
-                    print(f"✓ SAVED job {saved_count}: {job['job_title']} at {job['company_name']}")
+                    done_urls.append(job["job_url"])
                 else:
                     error_count += 1
-                    print(f"❌ FAILED to save to database: {job['job_title']}")
+                    failures.append((job["job_url"], "database insert failed"))
+        else:
+            for i, job in enumerate(new_jobs):
+                logger.debug("--- Processing job %s/%s ---", i+1, len(new_jobs))
+                logger.debug("Title: %s", job['job_title'])
+                logger.debug("Company: %s", job['company_name'])
+                logger.debug("Location: %s", job['location'])
+                logger.debug("URL: %s", job['job_url'])
+                
+                logger.debug("✓ New job, getting details...")
+                self.pace()
+                try:
+                    job_details = self.fetch_job_details(job["job_url"])
+                    job.update(job_details)
                     
-            except Exception as e:
-                error_count += 1
-                print(f"❌ ERROR getting job details: {str(e)}")
-            
-            time.sleep(self.config.delay_between_requests)
+                    if self._store_job(job, saved_count + 1):
+                        saved_count += 1
+                        done_urls.append(job["job_url"])
+                    else:
+                        error_count += 1
+                        failures.append((job["job_url"], "database insert failed"))
+                        
+                except Exception as e:
+                    error_count += 1
+                    failures.append((job["job_url"], e))
+                    self.dedup.release(job)
+                    logger.error("❌ ERROR getting job details: %s", e)
+        
+        jobs_total = self.metrics.counter(JOBS_TOTAL, "Jobs handled by save_jobs_to_database by outcome")
+        jobs_total.inc(saved_count, outcome="saved")
+        jobs_total.inc(duplicate_count, outcome="duplicate")
+        jobs_total.inc(error_count, outcome="error")
         
-        print(f"\n=== SAVE SUMMARY ===")
-        print(f"Total processed: {len(jobs)}")
-        print(f"Saved: {saved_count}")
-        print(f"Duplicates: {duplicate_count}")
-        print(f"Errors: {error_count}")
+        try:
+            self.db.finish_pending_jobs(done_urls, failures)
+        except Exception as e:
+            logger.warning("Could not update the pending jobs queue: %s", e)
+        
+        logger.info("=== SAVE SUMMARY ===")
+        logger.info("Total processed: %s", len(jobs))
+        logger.info("Saved: %s", saved_count)
+        logger.info("Duplicates: %s", duplicate_count)
+        logger.info("Errors: %s", error_count)
         
         return saved_count
     
+    def pending_retries(self, query_key: Optional[str] = None) -> List[Dict]:
+        # Cards queued by an interrupted crawl, minus those that already failed max_job_retries times
+        pending = self.db.get_pending_jobs(query_key, max_attempts=self.config.max_job_retries)
+        for job in pending:
+            job.pop("attempts", None)
+            job.pop("last_error", None)
+        return pending
+    
+    def retry_pending_jobs(self, query_key: Optional[str] = None) -> int:
+        pending = self.pending_retries(query_key)
+        if not pending:
+            return 0
+        
+        logger.info("Retrying %s queued jobs from an earlier crawl", len(pending))
+        return self.save_jobs_to_database(pending)
+    
+    def _store_job(self, job: Dict, job_number: int) -> bool:
+        with self.phases.time(phase="db_insert"):
+            added = self.db.add_job(job)
+        
+        if added:
+            self.dedup.add(job)
+            logger.info("✓ SAVED job %s: %s at %s", job_number, job['job_title'], job['company_name'])
+            return True
+        
+        self.dedup.release(job)
+        logger.error("❌ FAILED to save to database: %s", job['job_title'])
+        return False
+    
+    def get_enrichment_pool(self) -> EnrichmentPool:
+        if self.enrichment_pool is None:
+            if self.config.detail_fetch_mode == "http":
+                # Built here because workers must not touch the main driver
+                self.get_http_fetcher()
+            self.enrichment_pool = EnrichmentPool(
+                size=self.config.enrichment_workers,
+                driver_factory=self.create_driver,
+                fetch_details=self.fetch_job_details,
+                rate_limiter=self.rate_limiter,
+                worker_delay=self.config.enrichment_worker_delay,
+                # Workers reuse the logged-in session of the main browser
+                cookies=self.driver.get_cookies(),
+                cookie_domain_url=self.config.linkedin_base_url,
+                metrics=self.metrics
+            )
+        return self.enrichment_pool
+    
+    def export_metrics(self):
+        # Files are rewritten with the running totals after every search
+        self.metrics.export(self.config.metrics_json_file, self.config.metrics_prometheus_file)
+    
     def close(self):
+        if self.enrichment_pool:
+            self.enrichment_pool.close()
+            self.enrichment_pool = None
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
         if self.driver:
-            self.driver.quit()
\ No newline at end of file
+            self.driver.quit()
+        if self._owns_db:
+            self.db.close()
\ No newline at end of file
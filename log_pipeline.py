@@ -0,0 +1,134 @@
+import logging
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# Every module logs under this name, so one call to configure_logging routes all of them
+LOGGER_NAME = "linkedin"
+LOG_SINKS = ("console", "file", "gui")
+
+@dataclass
+class LogRecord:
+    message: str
+    level: str = "info"
+    created: float = field(default_factory=time.time)
+    thread: str = field(default_factory=lambda: threading.current_thread().name)
+    
+    def format(self) -> str:
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.created))
+        if self.level == "info":
+            return f"[{stamp}] {self.message}"
+        return f"[{stamp}] {self.level.upper()}: {self.message}"
+
+class LogQueue:
+    # Thread-safe hand-off between worker threads and the UI. Producers never
+    # block: once max_size records are waiting, new ones are counted as dropped
+    # and reported with the next batch.
+    def __init__(self, max_size: int = 10000):
+        self._queue = queue.Queue(maxsize=max_size)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def put(self, record: LogRecord):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+    
+    def emit(self, message: str, level: str = "info"):
+        self.put(LogRecord(message=message, level=level))
+    
+    def drain(self, max_records: int) -> List[LogRecord]:
+        records = []
+        while len(records) < max_records:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            records.append(LogRecord(message=f"{dropped} log messages dropped", level="warning"))
+        
+        return records
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+class DebugRateLimit(logging.Filter):
+    # Lets at most `rate` debug records per second through (with bursts up to
+    # one second's worth) and notes how many were skipped on the next one that
+    # passes. Records above DEBUG are never limited.
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._suppressed = 0
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate <= 0:
+            return True
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                self._suppressed += 1
+                return False
+            
+            self._tokens -= 1
+            suppressed, self._suppressed = self._suppressed, 0
+        
+        if suppressed:
+            record.msg = f"({suppressed} debug messages suppressed) {record.msg}"
+        return True
+
+class LogQueueHandler(logging.Handler):
+    # Hands records to the GUI's LogQueue; the message is only formatted here,
+    # after the level check and the debug rate limit have passed
+    def __init__(self, log_queue: LogQueue):
+        super().__init__()
+        self.log_queue = log_queue
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.log_queue.put(LogRecord(message=self.format(record), level=record.levelname.lower(),
+                                         created=record.created, thread=record.threadName))
+        except Exception:
+            self.handleError(record)
+
+def configure_logging(config, default_sink: str = "console", log_queue: Optional[LogQueue] = None) -> logging.Logger:
+    # config.log_sink overrides the caller's default; the GUI sink needs a LogQueue
+    sink = (config.log_sink or default_sink).lower()
+    if sink not in LOG_SINKS:
+        raise ValueError(f"Unknown log sink: {sink}")
+    if sink == "gui" and log_queue is None:
+        sink = "console"
+    
+    if sink == "gui":
+        handler = LogQueueHandler(log_queue)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    elif sink == "file":
+        handler = logging.FileHandler(config.log_file, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"))
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.addFilter(DebugRateLimit(config.debug_log_rate))
+    
+    logger = logging.getLogger(LOGGER_NAME)
+    for old_handler in list(logger.handlers):
+        logger.removeHandler(old_handler)
+        old_handler.close()
+    logger.addHandler(handler)
+    logger.setLevel(getattr(logging, config.log_level.upper(), logging.INFO))
+    logger.propagate = False
+    return logger
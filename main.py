@@ -6,10 +6,18 @@ from gui import main as gui_main
 from config import load_config
 from linkedin_automation import LinkedInAutomation
 from database import JobDatabase
+from metrics import REGISTRY
+from log_pipeline import configure_logging
 
 def main():
     if len(sys.argv) > 1 and sys.argv[1] == "--cli":
         run_cli()
+    elif len(sys.argv) > 2 and sys.argv[1] == "--batch":
+        run_batch(sys.argv[2])
+    elif len(sys.argv) > 1 and sys.argv[1] == "--resume":
+        run_resume()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--daemon":
+        run_daemon(sys.argv[2] if len(sys.argv) > 2 else "")
     else:
         gui_main()
 
@@ -18,12 +26,17 @@ def run_cli():
     print("=" * 40)
     
     config = load_config()
+    configure_logging(config)
     
     if not config.linkedin_email or not config.linkedin_password:
         print("Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in .env file")
         return
     
-    automation = LinkedInAutomation(config)
+    if config.metrics_port:
+        REGISTRY.serve(config.metrics_port)
+    
+    db = JobDatabase()
+    automation = LinkedInAutomation(config, db=db)
     
     try:
         print("Logging in to LinkedIn...")
@@ -50,11 +63,10 @@ def run_cli():
         
         print(f"Search completed! {len(jobs)} jobs saved to database.")
         
-        db = JobDatabase()
-        all_jobs = db.get_all_jobs()
+        latest = db.latest_jobs(5, ['job_title', 'company_name', 'location', 'application_url'])
         
-        print(f"\nTotal jobs in database: {len(all_jobs)}")
-        for job in all_jobs[-5:]:  # Show last 5 jobs
+        print(f"\nTotal jobs in database: {db.count_jobs()}")
+        for job in latest:  # Show last 5 jobs
             print(f"- {job['job_title']} at {job['company_name']} ({job['location']})")
             if job['application_url']:
                 print(f"  Apply: {job['application_url']}")
@@ -63,6 +75,116 @@ def run_cli():
         print(f"Error: {str(e)}")
     finally:
         automation.close()
+        db.close()
+
+def run_batch(queries_path: str):
+    print("LinkedIn Job Auto-Apply - Batch Mode")
+    print("=" * 40)
+    
+    config = load_config()
+    configure_logging(config)
+    
+    if not config.linkedin_email or not config.linkedin_password:
+        print("Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in .env file")
+        return
+    
+    if config.metrics_port:
+        REGISTRY.serve(config.metrics_port)
+    
+    from config import load_search_queries
+    from scheduler import SearchScheduler
+    
+    queries = load_search_queries(queries_path)
+    if not queries:
+        print(f"No searches found in {queries_path}")
+        return
+    
+    def report(event):
+        query = event["query"]
+        summary = event["summary"]
+        if event["event"] == "query_finished":
+            filters = query["filters"]
+            print(f"[{summary['done'] + summary['failed']}/{summary['queries']}] "
+                  f"{filters['job_title']} ({filters['location']}): {query['status']}, "
+                  f"{query['jobs_saved']} saved in {query['seconds']}s "
+                  f"- {summary['jobs_saved']} saved overall")
+    
+    db = JobDatabase()
+    try:
+        SearchScheduler(config, queries, db=db, progress_callback=report).run()
+    finally:
+        db.close()
+
+def run_resume():
+    print("LinkedIn Job Auto-Apply - Resume Mode")
+    print("=" * 40)
+    
+    config = load_config()
+    configure_logging(config)
+    
+    if not config.linkedin_email or not config.linkedin_password:
+        print("Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in .env file")
+        return
+    
+    db = JobDatabase()
+    checkpoints = db.get_unfinished_checkpoints()
+    pending = db.get_pending_jobs(max_attempts=config.max_job_retries)
+    if not checkpoints and not pending:
+        print("Nothing to resume: every crawl finished and no jobs are waiting for details")
+        db.close()
+        return
+    
+    if config.metrics_port:
+        REGISTRY.serve(config.metrics_port)
+    
+    from config import filters_from_dict
+    
+    automation = LinkedInAutomation(config, db=db)
+    try:
+        print("Logging in to LinkedIn...")
+        if not automation.login():
+            print("Login failed!")
+            return
+        
+        for checkpoint in checkpoints:
+            filters = filters_from_dict(checkpoint["filters"])
+            print(f"Resuming '{filters.job_title}' ({filters.location}) at page {checkpoint['next_page']}...")
+            automation.search_jobs(filters, resume=True)
+            print(f"{automation.last_search_stats.get('jobs_saved', 0)} jobs saved for this search")
+        
+        # Queued jobs whose crawl has since finished, or was never checkpointed
+        saved = automation.retry_pending_jobs()
+        if saved:
+            print(f"{saved} queued jobs saved")
+        print(f"\nTotal jobs in database: {db.count_jobs()}")
+    except Exception as e:
+        print(f"Error: {str(e)}")
+    finally:
+        automation.close()
+        db.close()
+
+def run_daemon(searches_path: str):
+    config = load_config()
+    configure_logging(config)
+    
+    if not config.linkedin_email or not config.linkedin_password:
+        print("Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in .env file")
+        return
+    
+    if config.metrics_port:
+        REGISTRY.serve(config.metrics_port)
+    
+    import signal
+    from daemon import CrawlDaemon
+    
+    # SIGTERM stops like Ctrl+C; an interrupted search resumes from its checkpoint on the next start
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
+    daemon = CrawlDaemon(config, searches_file=searches_path)
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        print("Daemon interrupted")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
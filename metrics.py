@@ -0,0 +1,282 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds in seconds; wide enough for both DB inserts and slow page loads
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+def _label_key(labels: Dict[str, str]) -> Tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _format_labels(key: Tuple, extra: Optional[Tuple] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = [(name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in pairs]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    kind = "counter"
+    
+    def __init__(self, name: str, help_text: str, lock: threading.Lock):
+        self.name = name
+        self.help_text = help_text
+        self._lock = lock
+        self._values = {}
+    
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return dict(self._values)
+    
+    def summary(self) -> Dict:
+        return {_format_labels(key) or "total": round(value, 4) for key, value in self.snapshot().items()}
+    
+    def prometheus_lines(self):
+        for key, value in sorted(self.snapshot().items()):
+            yield f"{self.name}{_format_labels(key)} {_format_value(value)}"
+
+class Gauge(Counter):
+    kind = "gauge"
+    
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+class Histogram:
+    kind = "histogram"
+    
+    def __init__(self, name: str, help_text: str, lock: threading.Lock, buckets: Tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._lock = lock
+        self._series = {}
+    
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0,
+                          "min": value, "max": value}
+                self._series[key] = series
+            
+            # Non-cumulative per bucket; the last slot is +Inf
+            index = len(self.buckets)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    index = i
+                    break
+            series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+            series["min"] = min(series["min"], value)
+            series["max"] = max(series["max"], value)
+    
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {key: dict(series, counts=list(series["counts"])) for key, series in self._series.items()}
+    
+    def quantile(self, series: Dict, q: float) -> float:
+        # Linear interpolation inside the bucket holding the q-th observation
+        rank = q * series["count"]
+        seen = 0
+        lower = 0.0
+        for i, count in enumerate(series["counts"]):
+            upper = self.buckets[i] if i < len(self.buckets) else series["max"]
+            if count and seen + count >= rank:
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(max(estimate, series["min"]), series["max"])
+            seen += count
+            lower = upper
+        return series["max"]
+    
+    def summary(self) -> Dict:
+        result = {}
+        for key, series in sorted(self.snapshot().items()):
+            result[_format_labels(key) or "total"] = {
+                "count": series["count"],
+                "sum_seconds": round(series["sum"], 4),
+                "mean_seconds": round(series["sum"] / series["count"], 4),
+                "p50_seconds": round(self.quantile(series, 0.5), 4),
+                "p95_seconds": round(self.quantile(series, 0.95), 4),
+                "max_seconds": round(series["max"], 4)
+            }
+        return result
+    
+    def prometheus_lines(self):
+        for key, series in sorted(self.snapshot().items()):
+            cumulative = 0
+            for i, count in enumerate(series["counts"]):
+                cumulative += count
+                bound = self.buckets[i] if i < len(self.buckets) else float("inf")
+                yield f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(key)} {_format_value(series['sum'])}"
+            yield f"{self.name}_count{_format_labels(key)} {series['count']}"
+
+class MetricsRegistry:
+    # Process-wide counters, gauges and latency histograms. Metrics are created
+    # on first use, so instrumented code only needs a name.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._server = None
+    
+    def _get(self, cls, name: str, help_text: str, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, help_text, threading.Lock(), **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+    
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        return self._get(Counter, name, help_text)
+    
+    def gauge(self, name: str, help_text: str = "") -> Gauge:
+        return self._get(Gauge, name, help_text)
+    
+    def histogram(self, name: str, help_text: str = "", buckets: Tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, buckets=buckets)
+    
+    def summary(self) -> Dict:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: {"type": metric.kind, "values": metric.summary()} for metric in metrics}
+    
+    def to_prometheus(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        
+        lines = []
+        for metric in metrics:
+            if metric.help_text:
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.prometheus_lines())
+        return "\n".join(lines) + "\n"
+    
+    def _write(self, path: str, content: str):
+        # Written beside the target and renamed, so readers such as the node
+        # exporter textfile collector never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    
+    def write_json(self, path: str):
+        self._write(path, json.dumps(self.summary(), indent=2))
+    
+    def write_prometheus(self, path: str):
+        self._write(path, self.to_prometheus())
+    
+    def export(self, json_path: str = "", prometheus_path: str = ""):
+        try:
+            if json_path:
+                self.write_json(json_path)
+            if prometheus_path:
+                self.write_prometheus(prometheus_path)
+        except OSError as e:
+            logger.warning("Could not write metrics: %s", e)
+    
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        # Exposes /metrics for a Prometheus scrape; started once per process
+        if self._server is not None:
+            return self._server
+        
+        registry = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+            
+            def do_GET(self):
+                if self.path.split("?")[0] == "/metrics":
+                    payload = registry.to_prometheus().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                elif self.path.split("?")[0] == "/metrics.json":
+                    payload = json.dumps(registry.summary()).encode("utf-8")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+        
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True).start()
+        logger.info("Serving metrics on http://%s:%s/metrics", host, self._server.server_address[1])
+        return self._server
+    
+    def stop_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+REGISTRY = MetricsRegistry()
+
+# Crawl metrics shared by LinkedInAutomation, the enrichment pool and the scheduler
+PHASE_SECONDS = "linkedin_phase_seconds"
+JOBS_TOTAL = "linkedin_jobs_total"
+SEARCH_PAGES_TOTAL = "linkedin_search_pages_total"
+CARDS_EXTRACTED_TOTAL = "linkedin_cards_extracted_total"
+LOGINS_TOTAL = "linkedin_logins_total"
+SLEEP_SECONDS_TOTAL = "linkedin_sleep_seconds_total"
+
+def phase_histogram(registry: MetricsRegistry = REGISTRY) -> Histogram:
+    return registry.histogram(PHASE_SECONDS, "Duration of each crawl phase in seconds")
+
+def print_summary(registry: MetricsRegistry = REGISTRY):
+    logger.info("=== METRICS ===")
+    for label, stats in phase_histogram(registry).summary().items():
+        logger.info("%s: %s x, p50 %ss, p95 %ss, total %ss", label, stats['count'],
+                    stats['p50_seconds'], stats['p95_seconds'], stats['sum_seconds'])
+    for name, metric in registry.summary().items():
+        if metric["type"] == "histogram":
+            continue
+        for label, value in metric["values"].items():
+            logger.info("%s%s: %s", name, '' if label == 'total' else label, value)
+
+def record_sleep(seconds: float, source: str, registry: MetricsRegistry = REGISTRY):
+    if seconds <= 0:
+        return
+    seconds = float(seconds)
+    phase_histogram(registry).observe(seconds, phase="sleep")
+    registry.counter(SLEEP_SECONDS_TOTAL, "Seconds spent deliberately sleeping between requests").inc(seconds, source=source)
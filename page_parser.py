@@ -0,0 +1,241 @@
+import importlib.util
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
+from bs4 import BeautifulSoup
+from log_pipeline import get_logger
+
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+logger = get_logger(__name__)
+
+JOB_CARD_SELECTORS = [
+    ".job-search-card",
+    ".jobs-search-results__list-item",
+    ".job-result-card",
+    "[data-job-id]",
+    ".jobs-search-results-list .jobs-search-results__list-item"
+]
+
+TITLE_SELECTORS = [
+    ".job-card-container__link",
+    "a[aria-label]",
+    ".job-card-list__title a",
+    ".job-search-card__title a",
+    ".job-result-card__title a",
+    "h3 a[data-control-name*='job']"
+]
+
+COMPANY_SELECTORS = [
+    ".artdeco-entity-lockup__subtitle",
+    ".job-card-container__company-name",
+    ".job-card-list__company-name",
+    "h4 a"
+]
+
+LOCATION_SELECTORS = [
+    ".job-card-container__metadata-item",
+    ".job-card-list__location"
+]
+
+DATE_SELECTORS = [
+    ".job-search-card__listitem--footerItem time",
+    ".job-result-card__listitem--footerItem time",
+    "time[datetime]"
+]
+
+LOCATION_INDICATORS = ["CA", "NY", "TX", "FL", "IL", "Remote", "Hybrid", "On-site", "Metropolitan Area", "United States", "(", ")"]
+
+JOB_ID_PATTERNS = [
+    re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)"),
+    re.compile(r"[?&]currentJobId=(\d+)")
+]
+
+# Search URL parameters that change ordering or paging but not which jobs match
+NON_QUERY_PARAMS = {"sortBy", "start", "currentJobId", "refresh", "origin"}
+
+def extract_job_id(job_url: str) -> str:
+    # LinkedIn's numeric posting id, or the URL without tracking parameters as a fallback
+    for pattern in JOB_ID_PATTERNS:
+        match = pattern.search(job_url or "")
+        if match:
+            return match.group(1)
+    return (job_url or "").split("?")[0]
+
+def normalize_search_url(search_url: str) -> str:
+    parsed = urlparse(search_url)
+    params = sorted(
+        (key, value.strip().lower())
+        for key, value in parse_qsl(parsed.query, keep_blank_values=False)
+        if key not in NON_QUERY_PARAMS
+    )
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}?{urlencode(params)}"
+
+def make_soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+def clean_title(job_title: str) -> str:
+    clean_job_title = job_title.split("\n")[0].strip()
+    if " with verification" in clean_job_title:
+        clean_job_title = clean_job_title.replace(" with verification", "")
+    return clean_job_title
+
+def classify_card_spans(job_title: str, span_texts: List[str]) -> Tuple[str, str]:
+    # Shared by the WebDriver and HTML extraction paths so both pick the same company/location
+    company_name = ""
+    location = ""
+    
+    logger.debug("All span texts: %s", span_texts)
+    
+    clean_job_title = clean_title(job_title)
+    
+    # Based on debug output, company is typically around index 2-3, location around index 3-4
+    skip_texts = [job_title, clean_job_title, "Promoted", "Easy Apply", "Actively hiring"]
+    # Also skip variations of the job title
+    if " with verification" in job_title:
+        skip_texts.append(job_title.replace(" with verification", ""))
+    
+    # Add the individual components that might appear in spans
+    job_title_parts = job_title.split()
+    job_title_first_part = job_title_parts[0] if job_title_parts else ""
+    if job_title_first_part:
+        # Find the base job title (first occurrence before repetition)
+        job_title_base = job_title.split(" " + job_title_first_part)[0].strip()
+        if job_title_base:
+            skip_texts.append(job_title_base)
+            skip_texts.append(job_title_base + " with verification")
+    
+    for i, text in enumerate(span_texts):
+        logger.debug("Checking span %s: '%s'", i, text)
+        # Skip job titles, "Promoted", "Easy Apply", etc.
+        if text and text not in skip_texts and len(text) > 2:
+            is_location = any(indicator in text for indicator in LOCATION_INDICATORS)
+            
+            if is_location:
+                if not location:
+                    location = text
+                    logger.debug("Found location: %s", location)
+            else:
+                if not company_name:
+                    company_name = text
+                    logger.debug("Found company: %s", company_name)
+                elif not location:
+                    # If we already have a company, this might be location
+                    location = text
+                    logger.debug("Found location (fallback): %s", location)
+    
+    return company_name, location
+
+def _text(element) -> str:
+    return element.get_text(" ", strip=True)
+
+def parse_job_card(card, base_url: str = "") -> Optional[Dict]:
+    job_title = ""
+    job_url = ""
+    
+    for selector in TITLE_SELECTORS:
+        title_element = card.select_one(selector)
+        if title_element is None:
+            continue
+        job_title = " ".join(_text(title_element).split())
+        job_url = title_element.get("href") or ""
+        if job_url:
+            job_url = urljoin(base_url, job_url)
+        break
+    
+    if not job_title:
+        return None
+    
+    span_texts = [_text(span) for span in card.find_all("span")]
+    company_name, location = classify_card_spans(job_title, [text for text in span_texts if text])
+    
+    if not company_name:
+        clean_job_title = clean_title(job_title)
+        for selector in COMPANY_SELECTORS:
+            element = card.select_one(selector)
+            if element is None:
+                continue
+            company_name = _text(element)
+            if company_name and company_name != clean_job_title:
+                break
+    
+    if not location:
+        for selector in LOCATION_SELECTORS:
+            element = card.select_one(selector)
+            if element is not None:
+                location = _text(element)
+                break
+    
+    posted_date = ""
+    for selector in DATE_SELECTORS:
+        element = card.select_one(selector)
+        if element is not None:
+            posted_date = element.get("datetime")
+            break
+    
+    return {
+        "job_title": job_title,
+        "company_name": company_name,
+        "location": location,
+        "job_url": job_url,
+        "posted_date": posted_date,
+        "application_url": "",
+        "job_description": "",
+        "salary_range": "",
+        "experience_level": "",
+        "employment_type": ""
+    }
+
+def find_job_cards(soup: BeautifulSoup) -> List:
+    for selector in JOB_CARD_SELECTORS:
+        cards = soup.select(selector)
+        if cards:
+            return cards
+    return []
+
+def parse_job_cards(html: str, base_url: str = "") -> Tuple[List[Dict], int]:
+    # One parse of page_source replaces the per-card WebDriver round trips.
+    # Returns the extracted jobs and the number of cards seen on the page.
+    cards = find_job_cards(make_soup(html))
+    jobs = []
+    
+    for card in cards:
+        job_data = parse_job_card(card, base_url)
+        if job_data:
+            jobs.append(job_data)
+    
+    return jobs, len(cards)
+
+DESCRIPTION_SELECTORS = [
+    ".job-details__description-text",
+    ".jobs-description__content",
+    ".show-more-less-html__markup",
+    ".description__text"
+]
+
+APPLY_LINK_SELECTOR = 'a[data-control-name="jobdetails_topcard_inapply"]'
+APPLY_BUTTON_SELECTOR = '.jobs-apply-button'
+SALARY_SELECTOR = ".job-details-jobs-unified-top-card__job-insight span"
+
+def parse_job_details(html: str, job_url: str) -> Dict:
+    # Mirrors LinkedInAutomation.get_job_details for pages fetched without a browser
+    soup = make_soup(html)
+    job_details = {"job_description": "", "application_url": "", "salary_range": ""}
+    
+    for selector in DESCRIPTION_SELECTORS:
+        element = soup.select_one(selector)
+        if element is not None:
+            job_details["job_description"] = element.get_text("\n", strip=True)
+            break
+    
+    apply_link = soup.select_one(APPLY_LINK_SELECTOR)
+    if apply_link is not None and apply_link.get("href"):
+        job_details["application_url"] = urljoin(job_url, apply_link["href"])
+    elif soup.select_one(APPLY_BUTTON_SELECTOR) is not None:
+        job_details["application_url"] = job_url
+    
+    salary = soup.select_one(SALARY_SELECTOR)
+    if salary is not None:
+        job_details["salary_range"] = _text(salary)
+    
+    return job_details
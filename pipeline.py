@@ -0,0 +1,114 @@
+import queue
+import threading
+from typing import Dict, List, Optional
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+PENDING_JOBS = "linkedin_pending_jobs"
+
+_STOP = object()
+
+class EnrichmentConsumer:
+    # Second stage of a pipelined search: the search browser only harvests cards
+    # (already queued durably in pending_jobs by the crawl checkpoint) and hands
+    # them over here, while this thread enriches and stores them through the
+    # automation's EnrichmentPool. The hand-off queue is bounded, so paging
+    # blocks once enrichment falls max_pending jobs behind.
+    def __init__(self, automation, max_pending: int = 100, batch_size: Optional[int] = None):
+        self.automation = automation
+        self.max_pending = max(1, max_pending)
+        self.batch_size = batch_size or max(1, automation.config.enrichment_workers) * 2
+        self.saved_count = 0
+        self._queue = queue.Queue(maxsize=self.max_pending)
+        self._lock = threading.Lock()
+        self._aborted = threading.Event()
+        self._thread = None
+    
+    def start(self) -> "EnrichmentConsumer":
+        if self._thread is not None:
+            return self
+        
+        # Built on this thread: the pool copies cookies from the search browser,
+        # which the producer keeps using while the consumer runs
+        self.automation.get_enrichment_pool()
+        self._thread = threading.Thread(target=self._run, name="enrichment-consumer", daemon=True)
+        self._thread.start()
+        return self
+    
+    def _publish_depth(self):
+        self.automation.metrics.gauge(PENDING_JOBS, "Harvested jobs waiting for enrichment").set(self._queue.qsize())
+    
+    def put(self, jobs: List[Dict]):
+        # Blocks while the queue is full; that wait is the back-pressure on paging
+        with self.automation.phases.time(phase="pipeline_backpressure"):
+            for job in jobs:
+                self._put(job)
+        self._publish_depth()
+    
+    def _put(self, item):
+        while True:
+            if self._aborted.is_set() or not self._thread.is_alive():
+                raise RuntimeError("Enrichment consumer is no longer running")
+            try:
+                self._queue.put(item, timeout=1.0)
+                return
+            except queue.Full:
+                continue
+    
+    def _next_batch(self) -> List:
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        try:
+            self._drain()
+        finally:
+            self.automation.db.release_thread_connection()
+    
+    def _drain(self):
+        while not self._aborted.is_set():
+            batch = self._next_batch()
+            self._publish_depth()
+            
+            stop = batch[-1] is _STOP
+            jobs = [job for job in batch if job is not _STOP]
+            if jobs and not self._aborted.is_set():
+                try:
+                    saved = self.automation.save_jobs_to_database(jobs, use_pool=True)
+                except Exception as e:
+                    # The jobs stay in pending_jobs for --resume
+                    logger.error("Enrichment batch failed: %s", e)
+                    saved = 0
+                with self._lock:
+                    self.saved_count += saved
+            
+            if stop:
+                break
+    
+    def saved(self) -> int:
+        with self._lock:
+            return self.saved_count
+    
+    def finish(self) -> int:
+        # Waits until everything handed over so far is enriched
+        if self._thread is None:
+            return 0
+        if self._thread.is_alive():
+            self._put(_STOP)
+            self._thread.join()
+        self._publish_depth()
+        return self.saved()
+    
+    def abort(self):
+        # Stops after the batch in progress; unprocessed jobs remain queued in the database
+        self._aborted.set()
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            pass
@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+from typing import Optional
+from log_pipeline import get_logger
+from metrics import MetricsRegistry, REGISTRY
+
+logger = get_logger(__name__)
+
+REQUEST_RATE = "linkedin_request_rate"
+THROTTLE_EVENTS_TOTAL = "linkedin_throttle_events_total"
+
+# URL fragments LinkedIn redirects to when it wants a human check
+THROTTLE_URL_MARKERS = ["checkpoint", "challenge"]
+
+def is_challenge_url(url: str) -> bool:
+    return any(marker in (url or "") for marker in THROTTLE_URL_MARKERS)
+
+class RateLimiter:
+    # Spaces request starts at least min_interval seconds apart across every thread sharing it
+    def __init__(self, min_interval: float):
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+    
+    def wait(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self.min_interval
+        
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+    
+    def success(self):
+        pass
+    
+    def throttled(self, reason: str):
+        pass
+
+class AdaptiveRateLimiter(RateLimiter):
+    # Token bucket (burst tokens, one more every `interval` seconds) shared by the
+    # search browser, enrichment workers and HTTP fetcher. Healthy responses
+    # shorten the interval a little at a time down to min_interval; throttling
+    # signals double it and pause everyone for an exponentially growing backoff.
+    def __init__(self, interval: float, min_interval: float = 1.0, max_interval: float = 60.0,
+                 burst: int = 1, jitter: float = 0.3, speedup: float = 0.95,
+                 backoff: float = 30.0, max_backoff: float = 600.0,
+                 metrics: Optional[MetricsRegistry] = None):
+        super().__init__(min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.interval = min(self.max_interval, max(self.min_interval, interval))
+        self.burst = max(1, burst)
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.speedup = speedup
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.consecutive_throttles = 0
+        self.metrics = metrics or REGISTRY
+        # Time the bucket is empty at; a request may start up to burst - 1 intervals early
+        self._empty_at = 0.0
+        self._publish_rate()
+    
+    @classmethod
+    def from_config(cls, config, metrics: Optional[MetricsRegistry] = None) -> "AdaptiveRateLimiter":
+        return cls(
+            interval=config.delay_between_requests,
+            min_interval=config.min_request_delay,
+            max_interval=config.max_request_delay,
+            jitter=config.request_jitter,
+            backoff=config.throttle_backoff,
+            metrics=metrics
+        )
+    
+    def _publish_rate(self):
+        # 0 means unlimited
+        rate = 1.0 / self.interval if self.interval > 0 else 0.0
+        self.metrics.gauge(REQUEST_RATE, "Requests per second currently allowed by the rate limiter").set(round(rate, 4))
+    
+    def wait(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            empty_at = max(self._empty_at, now)
+            start = max(now, empty_at - (self.burst - 1) * self.interval)
+            # Jitter each slot so requests don't land on a fixed beat
+            spacing = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._empty_at = empty_at + spacing
+        
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+    
+    def success(self):
+        with self._lock:
+            self.consecutive_throttles = 0
+            if self.interval <= self.min_interval:
+                return
+            self.interval = max(self.min_interval, self.interval * self.speedup)
+            if self.interval - self.min_interval < 0.01:
+                self.interval = self.min_interval
+        self._publish_rate()
+    
+    def throttled(self, reason: str):
+        with self._lock:
+            self.consecutive_throttles += 1
+            self.interval = min(self.max_interval, max(self.interval * 2, self.min_interval, 1.0))
+            pause = min(self.max_backoff, self.backoff * 2 ** (self.consecutive_throttles - 1))
+            # Nobody starts a request before the pause is over
+            self._empty_at = max(self._empty_at, time.monotonic() + pause)
+            interval = self.interval
+        
+        self.metrics.counter(THROTTLE_EVENTS_TOTAL, "Throttling signals seen by the rate limiter").inc(reason=reason)
+        self._publish_rate()
+        logger.warning("Throttling signal (%s): pausing %.1fs, then one request every %.1fs",
+                       reason, pause, interval)
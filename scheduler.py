@@ -0,0 +1,186 @@
+import queue
+import threading
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional
+from config import Config, SearchFilters
+from database import JobDatabase
+from dedup import DedupIndex
+from linkedin_automation import LinkedInAutomation
+from metrics import REGISTRY, print_summary
+from rate_limiter import AdaptiveRateLimiter
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+class SearchScheduler:
+    # Runs many SearchFilters over a bounded pool of logged-in browsers. All
+    # workers share one JobDatabase (whose write lock makes it the single
+    # writer) and one DedupIndex, so a posting found by two queries is only
+    # enriched once.
+    def __init__(self, config: Config, queries: List[SearchFilters], db: Optional[JobDatabase] = None,
+                 workers: Optional[int] = None, progress_callback: Optional[Callable[[Dict], None]] = None):
+        self.config = config
+        self.queries = list(queries)
+        self._owns_db = db is None
+        self.db = db if db is not None else JobDatabase()
+        self.workers = max(1, min(workers or config.search_workers, len(self.queries) or 1))
+        self.progress_callback = progress_callback
+        self.dedup = None
+        # One pace for every browser, since they all hit LinkedIn from the same account
+        self.rate_limiter = AdaptiveRateLimiter.from_config(config)
+        self.progress = [
+            {"index": i, "filters": asdict(filters), "status": "pending",
+             "jobs_processed": 0, "jobs_saved": 0, "seconds": 0.0, "error": ""}
+            for i, filters in enumerate(self.queries)
+        ]
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._automations = []
+        self._stopped = threading.Event()
+        self._started_at = None
+    
+    def _report(self, event: str, query: Optional[Dict] = None):
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback({"event": event, "query": dict(query) if query else None,
+                                    "summary": self.summary()})
+        except Exception as e:
+            logger.warning("Progress callback failed: %s", e)
+    
+    def summary(self) -> Dict:
+        with self._lock:
+            statuses = [query["status"] for query in self.progress]
+            saved = sum(query["jobs_saved"] for query in self.progress)
+            processed = sum(query["jobs_processed"] for query in self.progress)
+        
+        return {
+            "queries": len(self.progress),
+            "done": statuses.count("done"),
+            "failed": statuses.count("failed"),
+            "running": statuses.count("running"),
+            "jobs_processed": processed,
+            "jobs_saved": saved,
+            "elapsed_seconds": round(time.monotonic() - self._started_at, 1) if self._started_at else 0.0
+        }
+    
+    def _start_worker(self, number: int) -> Optional[LinkedInAutomation]:
+        try:
+            # Only the first worker gets the Chrome profile; the others restore its saved cookies
+            automation = LinkedInAutomation(self.config, db=self.db, dedup=self.dedup,
+                                            rate_limiter=self.rate_limiter, use_profile=number == 1)
+        except Exception as e:
+            logger.error("Search worker %s could not start a browser: %s", number, e)
+            return None
+        
+        with self._lock:
+            self._automations.append(automation)
+        
+        if not automation.login():
+            logger.error("Search worker %s could not log in", number)
+            return None
+        return automation
+    
+    def _worker(self, number: int, automation: Optional[LinkedInAutomation]):
+        try:
+            self._run_queries(number, automation)
+        finally:
+            self.db.release_thread_connection()
+    
+    def _run_queries(self, number: int, automation: Optional[LinkedInAutomation]):
+        if automation is None:
+            automation = self._start_worker(number)
+            if automation is None:
+                return
+        
+        while not self._stopped.is_set():
+            try:
+                index = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            
+            query = self.progress[index]
+            with self._lock:
+                query["status"] = "running"
+            self._report("query_started", query)
+            
+            start = time.monotonic()
+            try:
+                jobs = automation.search_jobs(self.queries[index])
+                stats = automation.last_search_stats
+                with self._lock:
+                    query["jobs_processed"] = stats.get("jobs_processed", len(jobs))
+                    query["jobs_saved"] = stats.get("jobs_saved", 0)
+                    query["status"] = "failed" if stats.get("error") else "done"
+                    query["error"] = stats.get("error", "")
+            except Exception as e:
+                with self._lock:
+                    query["status"] = "failed"
+                    query["error"] = str(e)
+            
+            with self._lock:
+                query["seconds"] = round(time.monotonic() - start, 1)
+            self._report("query_finished", query)
+    
+    def run(self) -> List[Dict]:
+        self._started_at = time.monotonic()
+        self.dedup = DedupIndex(self.db, max_exact_keys=self.config.dedup_max_exact_keys).load()
+        
+        for index in range(len(self.queries)):
+            self._tasks.put(index)
+        
+        logger.info("Running %s searches on %s browser workers", len(self.queries), self.workers)
+        
+        try:
+            # Log the first worker in alone so the others can reuse its saved session
+            first = self._start_worker(1)
+            if first is None:
+                logger.error("First search worker failed to start, aborting")
+                return self.finish()
+            
+            threads = [threading.Thread(target=self._worker, args=(1, first), name="search-1", daemon=True)]
+            for number in range(2, self.workers + 1):
+                threads.append(threading.Thread(target=self._worker, args=(number, None),
+                                                name=f"search-{number}", daemon=True))
+            
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            self.close()
+        
+        return self.finish()
+    
+    def finish(self) -> List[Dict]:
+        # Anything still queued had no live worker to run it
+        with self._lock:
+            for query in self.progress:
+                if query["status"] in ("pending", "running"):
+                    query["status"] = "failed"
+                    query["error"] = query["error"] or "not run"
+        
+        summary = self.summary()
+        logger.info("=== SCHEDULER SUMMARY ===")
+        logger.info("Queries: %s/%s done, %s failed", summary['done'], summary['queries'], summary['failed'])
+        logger.info("Jobs saved: %s of %s processed", summary['jobs_saved'], summary['jobs_processed'])
+        logger.info("Elapsed: %ss", summary['elapsed_seconds'])
+        print_summary(REGISTRY)
+        REGISTRY.export(self.config.metrics_json_file, self.config.metrics_prometheus_file)
+        self._report("finished")
+        return self.progress
+    
+    def stop(self):
+        self._stopped.set()
+    
+    def close(self):
+        with self._lock:
+            automations, self._automations = self._automations, []
+        for automation in automations:
+            try:
+                automation.close()
+            except Exception:
+                pass
+        if self._owns_db:
+            self.db.close()
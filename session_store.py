@@ -0,0 +1,45 @@
+import json
+import os
+import time
+from typing import Dict, List
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+class CookieJarStore:
+    # Persists the logged-in browser's cookies between runs. The file holds a
+    # live LinkedIn session, so it is written owner-readable only.
+    def __init__(self, path: str):
+        self.path = path
+    
+    def exists(self) -> bool:
+        return bool(self.path) and os.path.exists(self.path)
+    
+    def load(self) -> List[Dict]:
+        if not self.exists():
+            return []
+        
+        try:
+            with open(self.path, "r") as f:
+                cookies = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read saved session %s: %s", self.path, e)
+            return []
+        
+        now = time.time()
+        # Drop cookies that have expired since they were saved
+        return [cookie for cookie in cookies if cookie.get("expiry", now + 1) > now]
+    
+    def save(self, cookies: List[Dict]):
+        if not self.path:
+            return
+        
+        tmp_path = self.path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cookies, f)
+        os.replace(tmp_path, self.path)
+    
+    def clear(self):
+        if self.exists():
+            os.remove(self.path)
@@ -0,0 +1,56 @@
+from urllib.parse import urlparse
+import pytest
+from benchmarks.fake_linkedin import FakeLinkedInServer, SESSION_COOKIE, SESSION_TOKEN
+from http_fetcher import HttpDetailFetcher
+from rate_limiter import RateLimiter
+
+class RecordingRateLimiter(RateLimiter):
+    # Remembers the signals the fetcher reports instead of acting on them
+    def __init__(self):
+        super().__init__(0)
+        self.signals = []
+    
+    def success(self):
+        self.signals.append("success")
+    
+    def throttled(self, reason: str):
+        self.signals.append(reason)
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeLinkedInServer() as server:
+        yield server
+
+@pytest.fixture
+def limiter():
+    return RecordingRateLimiter()
+
+@pytest.fixture
+def fetcher(server, limiter):
+    cookies = [{"name": SESSION_COOKIE, "value": SESSION_TOKEN,
+                "domain": urlparse(server.base_url).hostname, "path": "/"}]
+    fetcher = HttpDetailFetcher(cookies=cookies, rate_limiter=limiter)
+    yield fetcher
+    fetcher.close()
+
+def test_parses_job_page(server, fetcher, limiter):
+    details = fetcher.fetch(f"{server.base_url}/jobs/view/job_detail/")
+    
+    assert "motion planning" in details["job_description"]
+    assert details["application_url"] == f"{server.base_url}/jobs/view/4012345678/apply/"
+    assert details["salary_range"] == "$120,000/yr - $150,000/yr"
+    assert limiter.signals == ["success"]
+
+def test_falls_back_without_description(server, fetcher):
+    assert fetcher.fetch(f"{server.base_url}/jobs/view/job_detail_no_description/") is None
+
+def test_falls_back_when_sent_to_login(server):
+    fetcher = HttpDetailFetcher()
+    try:
+        assert fetcher.fetch(f"{server.base_url}/jobs/view/job_detail/") is None
+    finally:
+        fetcher.close()
+
+def test_reports_429(server, fetcher, limiter):
+    assert fetcher.fetch(f"{server.base_url}/jobs/view/throttled/") is None
+    assert limiter.signals == ["http_429"]
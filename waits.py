@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from log_pipeline import get_logger
+
+logger = get_logger(__name__)
+
+class CardCountStable:
+    # Expected condition: job cards are present and their count has not changed
+    # for `settle` seconds (LinkedIn renders the result list incrementally).
+    def __init__(self, selectors: List[str], settle: float = 0.5):
+        self.selectors = selectors
+        self.settle = settle
+        self._last_count = -1
+        self._changed_at = time.monotonic()
+    
+    def __call__(self, driver):
+        count = 0
+        for selector in self.selectors:
+            count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+            if count:
+                break
+        
+        now = time.monotonic()
+        if count != self._last_count:
+            self._last_count = count
+            self._changed_at = now
+            return False
+        
+        if count and now - self._changed_at >= self.settle:
+            return count
+        return False
+
+class AdaptiveWaiter:
+    # Condition-driven waits whose timeouts follow the observed p95 duration of
+    # each phase, plus a running tally of the time spent waiting per phase.
+    def __init__(self, default_timeout: float = 15.0, min_timeout: float = 3.0,
+                 max_timeout: float = 60.0, headroom: float = 2.0,
+                 poll_frequency: float = 0.25, history: int = 50, min_samples: int = 5):
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.headroom = headroom
+        self.poll_frequency = poll_frequency
+        self.history = history
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._stats = {}
+    
+    def p95(self, phase: str) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(phase, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+    
+    def timeout_for(self, phase: str, default: Optional[float] = None) -> float:
+        with self._lock:
+            sample_count = len(self._samples.get(phase, ()))
+        if sample_count < self.min_samples:
+            return default if default is not None else self.default_timeout
+        return min(self.max_timeout, max(self.min_timeout, self.p95(phase) * self.headroom))
+    
+    def record(self, phase: str, elapsed: float, timed_out: bool = False):
+        with self._lock:
+            # Timeouts are not real load times, so they don't feed the p95
+            if not timed_out:
+                self._samples.setdefault(phase, deque(maxlen=self.history)).append(elapsed)
+            stats = self._stats.setdefault(phase, {"waits": 0, "timeouts": 0, "total_seconds": 0.0})
+            stats["waits"] += 1
+            stats["timeouts"] += int(timed_out)
+            stats["total_seconds"] += elapsed
+    
+    def wait_for(self, driver, condition: Callable, phase: str, timeout: Optional[float] = None):
+        timeout = timeout if timeout is not None else self.timeout_for(phase)
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+        except TimeoutException:
+            self.record(phase, time.monotonic() - start, timed_out=True)
+            return None
+        
+        self.record(phase, time.monotonic() - start)
+        return result
+    
+    def report(self) -> Dict[str, Dict]:
+        with self._lock:
+            phases = list(self._stats)
+        
+        report = {}
+        for phase in phases:
+            with self._lock:
+                stats = dict(self._stats[phase])
+            p95 = self.p95(phase)
+            stats["total_seconds"] = round(stats["total_seconds"], 3)
+            stats["p95_seconds"] = round(p95, 3) if p95 is not None else None
+            stats["next_timeout"] = round(self.timeout_for(phase), 3)
+            report[phase] = stats
+        return report
+    
+    def print_report(self):
+        logger.info("=== WAIT TIMES ===")
+        for phase, stats in self.report().items():
+            logger.info("%s: %ss over %s waits (p95 %ss, %s timeouts)", phase, stats['total_seconds'],
+                        stats['waits'], stats['p95_seconds'], stats['timeouts'])